@@ -14,7 +14,7 @@ from tqdm import tqdm
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent / 'ml'))
-from team_database import normalize_team_name as db_normalize_team
+from team_database import normalize_team_name as db_normalize_team, normalize_team_names as db_normalize_teams
 
 def fuzzy_match_score(str1: str, str2: str) -> float:
     """Calculate fuzzy match similarity between two strings"""
@@ -78,8 +78,8 @@ def load_historical_data(year: int = 2024) -> pd.DataFrame:
     df['date_str'] = df['date'].dt.strftime('%Y-%m-%d')
     
     # Normalize team names for matching
-    df['team_normalized'] = df['team'].apply(db_normalize_team)
-    df['opponent_normalized'] = df['opponent'].apply(db_normalize_team)
+    df['team_normalized'] = db_normalize_teams(df['team'])
+    df['opponent_normalized'] = db_normalize_teams(df['opponent'])
     
     print(f"  ✅ Loaded {len(df)} completed games from historical data")
     print(f"  Date range: {df['date'].min().date()} → {df['date'].max().date()}")
@@ -136,8 +136,9 @@ def normalize_team_name(team: str) -> str:
     ]
     
     for suffix in suffixes:
-        if team.endswith(suffix):
-            return team[:-len(suffix)]
+        stripped = team.removesuffix(suffix)
+        if stripped != team:
+            return stripped
     
     return team
 
@@ -82,8 +82,9 @@ def normalize_team_name(raw_name: str) -> str:
     for suffix in [' Huskies', ' Tar Heels', ' Blue Devils', ' Jayhawks', 
                    ' Wildcats', ' Cardinals', ' Orange', ' Spartans', 
                    ' Bulldogs', ' Bruins', ' Tigers', ' Bears']:
-        if raw_name.endswith(suffix):
-            base_name = raw_name[:-len(suffix)].strip()
+        base_name = raw_name.removesuffix(suffix)
+        if base_name != raw_name:
+            base_name = base_name.strip()
             if base_name in TEAM_NAME_MAPPING:
                 return TEAM_NAME_MAPPING[base_name]
             return base_name
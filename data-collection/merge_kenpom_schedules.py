@@ -338,8 +338,9 @@ def normalize_team_name(name):
     ]
     
     for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)].strip()
+        stripped = name.removesuffix(suffix)
+        if stripped != name:
+            name = stripped.strip()
             break
     
     # THIRD: Check mapping again after suffix removal
@@ -10,11 +10,13 @@ Each config defines:
     - name: Variant identifier
     - description: What this variant tests
     - features: List of feature groups to include
+    - model_type: 'gbm' (GradientBoostingClassifier) or 'hist_gbm' (HistGradientBoostingClassifier)
     - model_params: Model hyperparameters
     - time_decay: Whether to include time-based decay features
 """
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
 
 VARIANT_CONFIGS: Dict[str, Dict[str, Any]] = {
     'A': {
@@ -148,8 +150,9 @@ def get_variant_config(variant: str) -> Dict[str, Any]:
         raise ValueError(f"Unknown variant: {variant}. Must be one of {list(VARIANT_CONFIGS.keys())}")
     return VARIANT_CONFIGS[variant]
 
-def get_feature_list(variant: str) -> List[str]:
-    """Get complete list of features for a variant."""
+@lru_cache(maxsize=None)
+def _variant_features(variant: str) -> Tuple[str, ...]:
+    """Resolve a variant's feature groups to feature names (built once per variant)."""
     config = get_variant_config(variant)
     all_features = []
     
@@ -157,7 +160,11 @@ def get_feature_list(variant: str) -> List[str]:
         if group in FEATURE_DEFINITIONS:
             all_features.extend(FEATURE_DEFINITIONS[group]['features'])
     
-    return all_features
+    return tuple(all_features)
+
+def get_feature_list(variant: str) -> List[str]:
+    """Get complete list of features for a variant."""
+    return list(_variant_features(variant))
 
 def print_variant_summary(variant: str) -> None:
     """Print a summary of a variant's configuration."""
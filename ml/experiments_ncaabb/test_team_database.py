@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test Team Name Normalization
+
+Unit tests for the fuzzy fallback of normalize_team_name(), so that
+misspelled names still resolve while real namesakes stay apart, and for
+the edit distance and symmetric-delete index behind it.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add ml/ to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import team_database
+from team_database import normalize_team_name, normalize_team_names
+
+
+def _levenshtein_dp(a, b):
+    """Textbook dynamic-programming edit distance"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _closest_team_scan(name):
+    """_closest_team by scoring every variation, without the delete index
+    (the distance itself is checked against _levenshtein_dp separately)"""
+    scored = {}
+    for variation, canonical in team_database._VARIATION_TO_CANONICAL.items():
+        if team_database._swaps_direction(name, variation):
+            continue
+        longer = max(len(name), len(variation))
+        allowed = min(int(longer * (1 - team_database.FUZZY_CUTOFF)), team_database.FUZZY_MAX_EDITS)
+        distance = team_database._levenshtein(name, variation)
+        if distance <= allowed:
+            scored.setdefault(distance, set()).add(canonical)
+    if not scored:
+        return None
+    best_teams = scored[min(scored)]
+    return best_teams.pop() if len(best_teams) == 1 else None
+
+
+def _perturb(rng, name, edits):
+    """name with up to `edits` random single-character insertions, deletions or substitutions"""
+    letters = 'abcdefghijklmnopqrstuvwxyz '
+    for _ in range(edits):
+        position = rng.randrange(len(name) + 1)
+        operation = rng.choice(['insert', 'delete', 'substitute'])
+        if operation == 'insert':
+            name = name[:position] + rng.choice(letters) + name[position:]
+        elif name and position < len(name):
+            replacement = rng.choice(letters) if operation == 'substitute' else ''
+            name = name[:position] + replacement + name[position + 1:]
+    return name
+
+
+def test_fuzzy_keeps_namesakes_apart():
+    """Test schools missing from the table don't map onto their namesakes"""
+    assert normalize_team_name('Eastern Kentucky', fuzzy=True) == 'Eastern Kentucky'
+    assert normalize_team_name('Eastern Illinois', fuzzy=True) == 'Eastern Illinois'
+    print("✅ Namesakes: Not fuzzy-matched onto each other")
+
+
+def test_fuzzy_resolves_typos():
+    """Test near misses of known teams still resolve"""
+    assert normalize_team_name('Western Kentuky', fuzzy=True) == 'Western Kentucky'
+    assert normalize_team_name('Mississippi Stat', fuzzy=True) == 'Mississippi State'
+    print("✅ Typos: Resolved to the intended team")
+
+
+def test_normalize_team_names_keeps_dtype():
+    """Test the column-level normalize on plain and categorical columns"""
+    names = ['Duke Blue Devils', 'Kansas Jayhawks', 'Duke', None]
+    plain = normalize_team_names(pd.Series(names, name='home_team'))
+    assert plain.tolist()[:3] == ['Duke', 'Kansas', 'Duke'] and pd.isna(plain.iat[3])
+    assert plain.name == 'home_team'
+    
+    categorical = normalize_team_names(pd.Series(names, dtype='category', index=[4, 5, 6, 7]))
+    assert isinstance(categorical.dtype, pd.CategoricalDtype)
+    assert categorical.tolist()[:3] == ['Duke', 'Kansas', 'Duke'] and pd.isna(categorical.iat[3])
+    assert sorted(categorical.cat.categories) == ['Duke', 'Kansas']
+    assert categorical.index.tolist() == [4, 5, 6, 7]
+    print("✅ Columns: Plain and categorical names normalized")
+
+
+def test_levenshtein_matches_dp():
+    """Test the bit-parallel distance against the textbook DP on random strings"""
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = ''.join(rng.choice('abcd ') for _ in range(rng.randrange(0, 30)))
+        b = ''.join(rng.choice('abcd ') for _ in range(rng.randrange(0, 30)))
+        assert team_database._levenshtein(a, b) == _levenshtein_dp(a, b), (a, b)
+    # Patterns longer than a machine word
+    for _ in range(50):
+        a = ''.join(rng.choice('ab') for _ in range(rng.randrange(60, 140)))
+        b = ''.join(rng.choice('ab') for _ in range(rng.randrange(60, 140)))
+        assert team_database._levenshtein(a, b) == _levenshtein_dp(a, b), (a, b)
+    print("✅ Levenshtein: Matches the DP reference")
+
+
+def test_closest_team_matches_full_scan():
+    """Test the delete-index lookup against scoring every variation"""
+    rng = random.Random(1)
+    variations = sorted(team_database._VARIATION_TO_CANONICAL)
+    for _ in range(500):
+        name = _perturb(rng, rng.choice(variations), rng.randrange(0, 4))
+        assert team_database._closest_team(name) == _closest_team_scan(name), name
+    print("✅ Fuzzy index: Matches the full scan")
+
+
+if __name__ == '__main__':
+    print("="*60)
+    print("Testing Team Name Normalization")
+    print("="*60)
+    
+    test_fuzzy_keeps_namesakes_apart()
+    test_fuzzy_resolves_typos()
+    test_normalize_team_names_keeps_dtype()
+    test_levenshtein_matches_dp()
+    test_closest_team_matches_full_scan()
+    
+    print("\n" + "="*60)
+    print("✅ All tests passed!")
+    print("="*60)
@@ -13,100 +13,154 @@ Usage:
 """
 
 import argparse
+import hashlib
 import pandas as pd
 import numpy as np
 import joblib
+from joblib import Parallel, delayed
 from pathlib import Path
 import sys
-from sklearn.ensemble import GradientBoostingClassifier
+import warnings
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
 from sklearn.metrics import accuracy_score, roc_auc_score, brier_score_loss
+import json
 try:
-    from sklearn.calibration import calibration_curve
+    import orjson
 except ImportError:
-    # Fallback for older sklearn versions
-    from sklearn.metrics import calibration_curve
-import json
+    # Optional: faster JSON serialization, stdlib json otherwise
+    orjson = None
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, List, Optional
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config_models import get_variant_config, get_feature_list, print_variant_summary
+from config_models import FEATURE_DEFINITIONS, get_variant_config, get_feature_list, print_variant_summary
 from features_inseason_stats import build_inseason_stats
+from markets_ncaabb import american_to_prob_array
 
-def american_to_prob(odds):
-    """Convert American odds to implied probability."""
-    if pd.isna(odds):
-        return np.nan
-    if odds < 0:
-        return (-odds) / (-odds + 100)
-    else:
-        return 100 / (odds + 100)
+# Non-feature columns of walkforward_results_with_scores.csv used for
+# feature building, the in-season stats build, and the edges export
+MERGED_BASE_COLUMNS = [
+    'season', 'game_day', 'date', 'home_team', 'away_team',
+    'home_ml', 'away_ml', 'close_spread', 'home_score', 'away_score', 'home_won'
+]
+MERGED_DTYPES = {
+    'home_team': 'str', 'away_team': 'str',
+    'home_ml': 'float64', 'away_ml': 'float64', 'close_spread': 'float64',
+    'home_score': 'float64', 'away_score': 'float64'
+}
+
+def load_merged_games(merged_file: Path) -> pd.DataFrame:
+    """
+    Load the merged odds + KenPom + results CSV.
+    
+    Only the base columns and columns named in any feature group are
+    parsed; the file carries ~120 columns, most of which no variant uses.
+    """
+    wanted = set(MERGED_BASE_COLUMNS)
+    for group in FEATURE_DEFINITIONS.values():
+        wanted.update(group['features'])
+    return pd.read_csv(
+        merged_file,
+        usecols=lambda col: col in wanted,
+        dtype=MERGED_DTYPES,
+        parse_dates=['game_day', 'date']
+    )
 
 def build_market_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Build market-derived features."""
-    df = df.copy()
+    """Build market-derived features. Adds columns to df in place and returns it."""
+    close_spread = df['close_spread'].to_numpy(dtype=np.float64)
     
     # Implied probabilities
-    df['home_implied_prob'] = df['home_ml'].apply(american_to_prob)
-    df['away_implied_prob'] = df['away_ml'].apply(american_to_prob)
+    home_implied_prob = american_to_prob_array(df['home_ml'].to_numpy())
+    away_implied_prob = american_to_prob_array(df['away_ml'].to_numpy())
     
     # Market features
-    df['home_favorite'] = (df['close_spread'] < 0).astype(int)
-    df['spread_magnitude'] = df['close_spread'].abs()
-    df['prob_diff'] = df['home_implied_prob'] - df['away_implied_prob']
-    df['vig'] = df['home_implied_prob'] + df['away_implied_prob'] - 1.0
+    df['home_implied_prob'] = home_implied_prob
+    df['away_implied_prob'] = away_implied_prob
+    df['home_favorite'] = (close_spread < 0).astype(int)
+    df['spread_magnitude'] = np.abs(close_spread)
+    df['prob_diff'] = home_implied_prob - away_implied_prob
+    df['vig'] = home_implied_prob + away_implied_prob - 1.0
     
     return df
 
+# (diff column, minuend, subtrahend) for the preseason KenPom diffs
+KENPOM_DIFFS = [
+    ('AdjEM_diff', 'AdjEM_home', 'AdjEM_away'),
+    ('AdjOE_diff', 'AdjOE_home', 'AdjOE_away'),
+    ('AdjDE_diff', 'AdjDE_away', 'AdjDE_home'),  # Lower DE is better
+    ('AdjTempo_diff', 'AdjTempo_home', 'AdjTempo_away'),
+    ('SOS_diff', 'SOS_home', 'SOS_away'),
+    ('Luck_diff', 'Luck_home', 'Luck_away'),
+]
+
 def build_preseason_kenpom_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Build preseason KenPom features (treat season-end ratings as static priors)."""
-    df = df.copy()
+    """
+    Build preseason KenPom features (treat season-end ratings as static priors).
     
-    # Compute diffs if base columns exist
+    Adds columns to df in place and returns it.
+    """
+    # Compute diffs if base columns exist, as one (n, 6) array subtraction
     if 'AdjEM_home' in df.columns and 'AdjEM_away' in df.columns:
-        df['AdjEM_diff'] = df['AdjEM_home'] - df['AdjEM_away']
-        df['AdjOE_diff'] = df['AdjOE_home'] - df['AdjOE_away']
-        df['AdjDE_diff'] = df['AdjDE_away'] - df['AdjDE_home']  # Lower DE is better
-        df['AdjTempo_diff'] = df['AdjTempo_home'] - df['AdjTempo_away']
-        df['SOS_diff'] = df['SOS_home'] - df['SOS_away']
-        df['Luck_diff'] = df['Luck_home'] - df['Luck_away']
+        diff_cols, left_cols, right_cols = map(list, zip(*KENPOM_DIFFS))
+        df[diff_cols] = (
+            df[left_cols].to_numpy(dtype=np.float64) - df[right_cols].to_numpy(dtype=np.float64)
+        )
     
     return df
 
-def build_time_decay_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Build time-based features for preseason prior decay."""
-    df = df.copy()
+def _running_count(keys: pd.Series) -> np.ndarray:
+    """
+    Per-key running count in row order (same as groupby(keys).cumcount()).
     
+    Factorizes the keys and does one stable sort instead of a groupby.
+    """
+    codes, _ = pd.factorize(keys)
+    n = len(codes)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    positions = np.arange(n)
+    is_group_start = np.ones(n, dtype=bool)
+    is_group_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    group_start = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+    counts = np.empty(n, dtype=np.int64)
+    counts[order] = positions - group_start
+    return counts
+
+def build_time_decay_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Build time-based features for preseason prior decay. Adds columns to df in place and returns it."""
     # Ensure date is datetime
     if 'date' not in df.columns:
         df['date'] = pd.to_datetime(df['game_day'])
     else:
         df['date'] = pd.to_datetime(df['date'])
     
-    # Season start (approximate: Nov 6)
-    df['season_start'] = pd.to_datetime(df['season'].astype(str).str[:4] + '-11-06')
+    # Season start (approximate: Nov 6), parsed once per distinct season
+    seasons = df['season'].unique()
+    season_starts = pd.to_datetime(pd.Series(seasons).astype(str).str[:4] + '-11-06')
+    df['season_start'] = df['season'].map(dict(zip(seasons, season_starts)))
     df['days_into_season'] = (df['date'] - df['season_start']).dt.days
     
     # Games played (if available from in-season stats)
     if 'games_played_home' not in df.columns:
         # Estimate: assign sequential game numbers per team
-        df['games_played_home'] = df.groupby('home_team').cumcount()
-        df['games_played_away'] = df.groupby('away_team').cumcount()
+        df['games_played_home'] = _running_count(df['home_team'])
+        df['games_played_away'] = _running_count(df['away_team'])
     
     # Season progress (0 at start, 1 at end)
     # Assume ~140 days season (Nov 6 to Mar 25)
-    df['season_progress'] = df['days_into_season'] / 140.0
-    df['season_progress'] = df['season_progress'].clip(0, 1)
+    df['season_progress'] = np.clip(df['days_into_season'].to_numpy() / 140.0, 0, 1)
     
     return df
 
 def prepare_features_for_variant(
     variant: str,
     merged_df: pd.DataFrame,
-    inseason_df: pd.DataFrame = None
+    inseason_df: pd.DataFrame = None,
+    config: Optional[Dict[str, Any]] = None
 ) -> pd.DataFrame:
     """
     Prepare features for a specific variant.
@@ -115,15 +169,18 @@ def prepare_features_for_variant(
         variant: 'A', 'B', or 'C'
         merged_df: Merged odds + KenPom data
         inseason_df: Optional dataframe with in-season stats
+        config: Variant config, if the caller already has it
     
     Returns:
         DataFrame with all features for this variant
     """
-    config = get_variant_config(variant)
+    if config is None:
+        config = get_variant_config(variant)
     print(f"\n{'='*60}")
     print(f"Preparing Features for Variant {variant}")
     print(f"{'='*60}")
     
+    # Single copy up front; the build_* helpers below add columns in place
     df = merged_df.copy()
     
     # Build market features (all variants use these)
@@ -149,8 +206,20 @@ def prepare_features_for_variant(
         
         # Get in-season columns
         inseason_cols = [col for col in inseason_df.columns if '_L' in col or col in ['date', 'home_team', 'away_team']]
+        inseason_df = inseason_df[inseason_cols].copy()
+        
+        # Join on shared categorical team keys so the merge hashes integer codes
+        team_cols = ['home_team', 'away_team']
+        team_dtype = pd.CategoricalDtype(
+            pd.concat([df[col] for col in team_cols] + [inseason_df[col] for col in team_cols])
+            .dropna().unique()
+        )
+        for col in team_cols:
+            df[col] = df[col].astype(team_dtype)
+            inseason_df[col] = inseason_df[col].astype(team_dtype)
+        
         df = df.merge(
-            inseason_df[inseason_cols],
+            inseason_df,
             on=['date', 'home_team', 'away_team'],
             how='left'
         )
@@ -158,14 +227,104 @@ def prepare_features_for_variant(
     
     return df
 
+def _feature_cache_file(variant: str, data_dir: Path, sources: List[Path]) -> Path:
+    """
+    Path of the cached feature frame for a variant.
+    
+    The key covers the variant plus the modification times of the input
+    CSVs and the feature-building code, so any change to either
+    invalidates the cache.
+    """
+    key_parts = [variant] + [
+        f"{src.name}:{src.stat().st_mtime_ns if src.exists() else 'missing'}"
+        for src in sources
+    ]
+    key = hashlib.sha1('|'.join(key_parts).encode()).hexdigest()[:16]
+    cache_dir = data_dir / 'cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f'features_variant_{variant}_{key}.pkl'
+
+def _write_json(path: Path, obj: Dict) -> None:
+    """Write obj as 2-space indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+def load_inseason_stats(merged_df: pd.DataFrame, inseason_file: Path) -> pd.DataFrame:
+    """Load pre-computed in-season stats, building and saving them first if missing."""
+    if inseason_file.exists():
+        print(f"   Loading pre-computed in-season stats...")
+        return pd.read_csv(inseason_file)
+    
+    print(f"   Building in-season stats (this may take a minute)...")
+    inseason_df = build_inseason_stats(merged_df.copy())
+    inseason_df.to_csv(inseason_file, index=False)
+    print(f"   Saved in-season stats to: {inseason_file}")
+    return inseason_df
+
+def calibration_bins(y_true: np.ndarray, y_prob: np.ndarray, n_bins: int = 10):
+    """
+    Uniform-width reliability bins in one pass.
+    
+    Same bin assignment and output as sklearn's
+    calibration_curve(strategy='uniform') (empty bins dropped), plus the
+    number of predictions in each returned bin.
+    
+    Returns:
+        (prob_true, prob_pred, counts) for the non-empty bins
+    """
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    bin_ids = np.searchsorted(edges[1:-1], y_prob)
+    counts = np.bincount(bin_ids, minlength=n_bins)
+    sum_true = np.bincount(bin_ids, weights=y_true, minlength=n_bins)
+    sum_pred = np.bincount(bin_ids, weights=y_prob, minlength=n_bins)
+    nonzero = counts > 0
+    return (
+        sum_true[nonzero] / counts[nonzero],
+        sum_pred[nonzero] / counts[nonzero],
+        counts[nonzero]
+    )
+
+def build_classifier(model_type: str, model_params: Dict[str, Any]):
+    """
+    Construct the classifier for a model type.
+    
+    'gbm' is GradientBoostingClassifier with model_params as given.
+    'hist_gbm' is the histogram-based HistGradientBoostingClassifier, with
+    the GBM params mapped onto it (n_estimators -> max_iter); it is much
+    faster to fit and handles NaN features natively.
+    """
+    if model_type == 'gbm':
+        return GradientBoostingClassifier(**model_params)
+    if model_type == 'hist_gbm':
+        return HistGradientBoostingClassifier(
+            max_iter=model_params.get('n_estimators', 100),
+            learning_rate=model_params.get('learning_rate', 0.1),
+            max_depth=model_params.get('max_depth'),
+            min_samples_leaf=model_params.get('min_samples_leaf', 20),
+            random_state=model_params.get('random_state')
+        )
+    raise ValueError(f"Unknown model type: {model_type}. Must be one of ['gbm', 'hist_gbm']")
+
 def train_and_evaluate_variant(
     variant: str,
     train_cutoff: str,
-    data_dir: Path
+    data_dir: Path,
+    use_cache: bool = True,
+    model_type: Optional[str] = None,
+    merged_df: Optional[pd.DataFrame] = None
 ) -> Dict:
     """
     Train and evaluate a model variant.
     
+    The feature-engineered frame is cached under data_dir/cache and reused
+    while its inputs are unchanged; pass use_cache=False to rebuild it.
+    model_type overrides the variant config's model type ('gbm' or 'hist_gbm').
+    merged_df, if given, is used instead of reading the merged CSV (lets
+    several variants share one load); it is not modified.
+    
     Returns dictionary with metrics and paths to outputs.
     """
     print(f"\n{'='*80}")
@@ -173,29 +332,48 @@ def train_and_evaluate_variant(
     print(f"{'='*80}")
     
     config = get_variant_config(variant)
+    model_type = model_type or config['model_type']
     print_variant_summary(variant)
     
-    # Load data
-    print(f"\n📂 Loading data...")
     merged_file = data_dir / 'walkforward_results_with_scores.csv'
-    merged_df = pd.read_csv(merged_file)
-    print(f"   Loaded {len(merged_df)} games from {merged_file.name}")
-    
-    # Load/build in-season stats if needed
-    inseason_df = None
+    inseason_file = data_dir / 'merged' / 'game_results_with_inseason_stats.csv'
+    # The feature-building code: this module, the variant config, and the
+    # shared market and in-season stats helpers it calls into
+    cache_sources = [
+        merged_file, Path(__file__), Path(__file__).parent / 'config_models.py',
+        Path(__file__).parent.parent / 'markets_ncaabb.py',
+        Path(__file__).parent.parent / 'features_inseason_stats.py',
+    ]
     if config['use_inseason_stats']:
-        inseason_file = data_dir / 'merged' / 'game_results_with_inseason_stats.csv'
-        if inseason_file.exists():
-            print(f"   Loading pre-computed in-season stats...")
-            inseason_df = pd.read_csv(inseason_file)
-        else:
-            print(f"   Building in-season stats (this may take a minute)...")
-            inseason_df = build_inseason_stats(merged_df.copy())
-            inseason_df.to_csv(inseason_file, index=False)
-            print(f"   Saved in-season stats to: {inseason_file}")
-    
-    # Prepare features
-    df = prepare_features_for_variant(variant, merged_df, inseason_df)
+        cache_sources.append(inseason_file)
+    
+    cache_file = _feature_cache_file(variant, data_dir, cache_sources) if use_cache else None
+    if cache_file is not None and cache_file.exists():
+        print(f"\n📂 Loading cached features from {cache_file.name}...")
+        df = pd.read_pickle(cache_file)
+        print(f"   Loaded {len(df)} rows")
+    else:
+        # Load data
+        if merged_df is None:
+            print(f"\n📂 Loading data...")
+            merged_df = load_merged_games(merged_file)
+            print(f"   Loaded {len(merged_df)} games from {merged_file.name}")
+        
+        # Load/build in-season stats if needed
+        inseason_df = None
+        if config['use_inseason_stats']:
+            inseason_df = load_inseason_stats(merged_df, inseason_file)
+        
+        # Prepare features
+        df = prepare_features_for_variant(variant, merged_df, inseason_df, config=config)
+        
+        if use_cache:
+            # Re-key: the in-season stats file may have just been written
+            cache_file = _feature_cache_file(variant, data_dir, cache_sources)
+            for stale in cache_file.parent.glob(f'features_variant_{variant}_*.pkl'):
+                stale.unlink()
+            df.to_pickle(cache_file)
+            print(f"   Cached features to: {cache_file}")
     
     # Get feature list for this variant
     feature_list = get_feature_list(variant)
@@ -213,42 +391,55 @@ def train_and_evaluate_variant(
     print(f"   Available features: {len(available_features)}")
     print(f"   Missing: {len(missing_features)}")
     
-    # Filter to games with outcomes
-    df = df[df['home_won'].notna()].copy()
+    # Filter to games with outcomes, sorted once by date so the
+    # time-aware train/test split below is a pair of contiguous slices
+    df['date'] = pd.to_datetime(df.get('date', df['game_day']))
+    df = df[df['home_won'].notna()].sort_values('date', kind='mergesort').reset_index(drop=True)
     print(f"\n   Games with outcomes: {len(df)}")
     
+    # Time-aware split
+    train_cutoff_date = pd.to_datetime(train_cutoff)
+    cut = int(df['date'].searchsorted(train_cutoff_date, side='left'))
+    if cut == 0 or cut == len(df):
+        empty = 'train' if cut == 0 else 'test'
+        date_range = (
+            f"{df['date'].iat[0].date()} → {df['date'].iat[-1].date()}" if len(df) else "no games"
+        )
+        raise ValueError(
+            f"train_cutoff {train_cutoff} leaves the {empty} split empty "
+            f"(games with outcomes: {date_range})"
+        )
+
     # Create target
     y = df['home_won'].astype(int)
     
-    # Create feature matrix
-    X = df[available_features].copy()
-    
-    # Fill missing values with median
-    X = X.fillna(X.median())
-    
-    # Handle any remaining NaNs
-    X = X.fillna(0)
+    # Create feature matrix (float32 is what sklearn's tree code works in,
+    # so converting here avoids a second float64 -> float32 copy in fit)
+    X = df[available_features].to_numpy(dtype=np.float32, copy=True)
     
-    # Time-aware split
-    df['date'] = pd.to_datetime(df.get('date', df['game_day']))
-    train_cutoff_date = pd.to_datetime(train_cutoff)
+    # Fill missing values with the column median (0 for all-NaN columns);
+    # the histogram model routes NaNs itself
+    if model_type != 'hist_gbm':
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            medians = np.nanmedian(X, axis=0)
+        medians = np.nan_to_num(medians, nan=0.0)
+        nan_rows, nan_cols = np.nonzero(np.isnan(X))
+        X[nan_rows, nan_cols] = medians[nan_cols]
     
-    train_mask = df['date'] < train_cutoff_date
-    test_mask = df['date'] >= train_cutoff_date
-    
-    X_train, X_test = X[train_mask], X[test_mask]
-    y_train, y_test = y[train_mask], y[test_mask]
+    X_train, X_test = X[:cut], X[cut:]
+    y_train, y_test = y.iloc[:cut].to_numpy(), y.iloc[cut:].to_numpy()
     
     print(f"\n📅 Train/Test Split:")
     print(f"   Train cutoff: {train_cutoff}")
-    print(f"   Train games: {len(X_train)} ({train_mask.sum()})")
-    print(f"   Test games: {len(X_test)} ({test_mask.sum()})")
-    print(f"   Train date range: {df[train_mask]['date'].min().date()} → {df[train_mask]['date'].max().date()}")
-    print(f"   Test date range: {df[test_mask]['date'].min().date()} → {df[test_mask]['date'].max().date()}")
+    print(f"   Train games: {len(X_train)}")
+    print(f"   Test games: {len(X_test)}")
+    print(f"   Train date range: {df['date'].iat[0].date()} → {df['date'].iat[cut - 1].date()}")
+    print(f"   Test date range: {df['date'].iat[cut].date()} → {df['date'].iat[-1].date()}")
     
     # Train model
-    print(f"\n🔧 Training {config['model_type'].upper()} model...")
-    model = GradientBoostingClassifier(**config['model_params'])
+    print(f"\n🔧 Training {model_type.upper()} model...")
+    model = build_classifier(model_type, config['model_params'])
     model.fit(X_train, y_train)
     print(f"   ✅ Model trained")
     
@@ -286,15 +477,13 @@ def train_and_evaluate_variant(
     
     # Calibration
     print(f"\nCalibration (Test Set):")
-    prob_true, prob_pred = calibration_curve(y_test, y_proba_test, n_bins=10, strategy='uniform')
+    prob_true, prob_pred, bin_counts = calibration_bins(y_test, y_proba_test, n_bins=10)
     
     print(f"{'Predicted':<12} {'Actual':<12} {'Count':<8} {'Error':<8}")
     print("-" * 50)
     for i in range(len(prob_pred)):
-        bin_mask = (y_proba_test >= i/10) & (y_proba_test < (i+1)/10)
-        count = bin_mask.sum()
         error = abs(prob_pred[i] - prob_true[i])
-        print(f"{prob_pred[i]:<12.3f} {prob_true[i]:<12.3f} {count:<8} {error:<8.3f}")
+        print(f"{prob_pred[i]:<12.3f} {prob_true[i]:<12.3f} {bin_counts[i]:<8} {error:<8.3f}")
     
     # Feature importance
     if hasattr(model, 'feature_importances_'):
@@ -308,25 +497,25 @@ def train_and_evaluate_variant(
     # Export predictions with edges
     print(f"\n💾 Exporting predictions...")
     
-    test_df = df[test_mask].copy()
-    test_df['model_prob_home'] = y_proba_test
-    test_df['model_prob_away'] = 1 - y_proba_test
-    test_df['edge_home'] = test_df['model_prob_home'] - test_df['home_implied_prob']
-    test_df['edge_away'] = test_df['model_prob_away'] - test_df['away_implied_prob']
+    # Build the export frame straight from the test slice's arrays
+    test_rows = df.iloc[cut:]
+    edges = {col: test_rows[col].to_numpy() for col in [
+        'date', 'home_team', 'away_team',
+        'home_ml', 'away_ml', 'home_implied_prob', 'away_implied_prob'
+    ]}
+    edges['model_prob_home'] = y_proba_test
+    edges['model_prob_away'] = 1 - y_proba_test
+    edges['edge_home'] = edges['model_prob_home'] - edges['home_implied_prob']
+    edges['edge_away'] = edges['model_prob_away'] - edges['away_implied_prob']
+    for col in ['home_won', 'home_score', 'away_score']:
+        edges[col] = test_rows[col].to_numpy()
     
     # Save edges
     edges_dir = data_dir / 'edges'
     edges_dir.mkdir(parents=True, exist_ok=True)
     edges_file = edges_dir / f'edges_ncaabb_variant_{variant}.csv'
     
-    export_cols = [
-        'date', 'home_team', 'away_team',
-        'home_ml', 'away_ml', 'home_implied_prob', 'away_implied_prob',
-        'model_prob_home', 'model_prob_away',
-        'edge_home', 'edge_away',
-        'home_won', 'home_score', 'away_score'
-    ]
-    test_df[export_cols].to_csv(edges_file, index=False)
+    pd.DataFrame(edges).to_csv(edges_file, index=False)
     print(f"   Saved edges to: {edges_file}")
     
     # Save metrics
@@ -352,8 +541,7 @@ def train_and_evaluate_variant(
     }
     
     metrics_file = edges_dir / f'metrics_variant_{variant}.json'
-    with open(metrics_file, 'w') as f:
-        json.dump(metrics, f, indent=2)
+    _write_json(metrics_file, metrics)
     print(f"   Saved metrics to: {metrics_file}")
     
     # Save the trained model
@@ -361,13 +549,15 @@ def train_and_evaluate_variant(
     model_dir.mkdir(parents=True, exist_ok=True)
     
     model_file = model_dir / f'variant_{variant.lower()}_model.pkl'
-    joblib.dump(model, model_file)
+    # zlib level 3: several times smaller than a raw pickle and still fast to
+    # load. Production artifacts are always compressed (freeze_variant_b_model.py
+    # writes the same way), so the Variant B loader reads them without mmap_mode
+    joblib.dump(model, model_file, compress=('zlib', 3))
     print(f"   Saved model to: {model_file}")
     
     # Save feature columns
     features_file = model_dir / f'variant_{variant.lower()}_features.json'
-    with open(features_file, 'w') as f:
-        json.dump({'feature_cols': available_features}, f, indent=2)
+    _write_json(features_file, {'feature_cols': available_features})
     print(f"   Saved features to: {features_file}")
     
     # Save metadata
@@ -385,41 +575,98 @@ def train_and_evaluate_variant(
         },
         'n_features': len(available_features),
         'feature_groups': config['feature_groups'],
-        'model_type': config['model_type'],
+        'model_type': model_type,
         'notes': f'Trained on {len(X_train)} games, tested on {len(X_test)} games'
     }
     
     metadata_file = model_dir / f'variant_{variant.lower()}_metadata.json'
-    with open(metadata_file, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    _write_json(metadata_file, metadata)
     print(f"   Saved metadata to: {metadata_file}")
     
     print(f"\n✅ Variant {variant} training complete!")
     
     return metrics
 
+def train_variants_parallel(
+    variants: List[str],
+    train_cutoff: str,
+    data_dir: Path,
+    use_cache: bool = True,
+    model_type: Optional[str] = None
+) -> Dict[str, Dict]:
+    """
+    Train several variants concurrently, one joblib worker per variant.
+    
+    The merged CSV is read once and shared, and in-season stats are built
+    up front if any variant needs them, so workers never race to write
+    the same file.
+    """
+    merged_file = data_dir / 'walkforward_results_with_scores.csv'
+    print(f"\n📂 Loading data...")
+    merged_df = load_merged_games(merged_file)
+    print(f"   Loaded {len(merged_df)} games from {merged_file.name}")
+    
+    inseason_file = data_dir / 'merged' / 'game_results_with_inseason_stats.csv'
+    if any(get_variant_config(v)['use_inseason_stats'] for v in variants) and not inseason_file.exists():
+        load_inseason_stats(merged_df, inseason_file)
+    
+    results = Parallel(n_jobs=len(variants), backend='loky')(
+        delayed(train_and_evaluate_variant)(
+            variant, train_cutoff, data_dir, use_cache, model_type, merged_df
+        )
+        for variant in variants
+    )
+    return dict(zip(variants, results))
+
 def main():
     parser = argparse.ArgumentParser(description='Train and evaluate a model variant')
-    parser.add_argument('--variant', type=str, required=True, choices=['A', 'B', 'C'],
+    parser.add_argument('--variant', type=str, choices=['A', 'B', 'C'],
                        help='Model variant to train (A, B, or C)')
+    parser.add_argument('--variants', type=str, default=None,
+                       help='Comma-separated variants to train in parallel (e.g. A,B,C)')
     parser.add_argument('--train-cutoff', type=str, default='2024-02-01',
                        help='Date cutoff for train/test split (YYYY-MM-DD)')
+    parser.add_argument('--model-type', type=str, default=None, choices=['gbm', 'hist_gbm'],
+                       help='Override the variant config model type')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Rebuild features instead of using the cached feature frame')
     args = parser.parse_args()
     
+    if args.variants:
+        variants = [v.strip().upper() for v in args.variants.split(',') if v.strip()]
+        for variant in variants:
+            get_variant_config(variant)  # raises on unknown variant
+    elif args.variant:
+        variants = [args.variant]
+    else:
+        parser.error('one of --variant or --variants is required')
+    
     data_dir = Path(__file__).parent.parent.parent / 'data'
     
-    metrics = train_and_evaluate_variant(
-        variant=args.variant,
-        train_cutoff=args.train_cutoff,
-        data_dir=data_dir
-    )
+    if len(variants) == 1:
+        all_metrics = {variants[0]: train_and_evaluate_variant(
+            variant=variants[0],
+            train_cutoff=args.train_cutoff,
+            data_dir=data_dir,
+            use_cache=not args.no_cache,
+            model_type=args.model_type
+        )}
+    else:
+        all_metrics = train_variants_parallel(
+            variants,
+            train_cutoff=args.train_cutoff,
+            data_dir=data_dir,
+            use_cache=not args.no_cache,
+            model_type=args.model_type
+        )
     
-    print(f"\n{'='*80}")
-    print(f"✅ TRAINING COMPLETE - Variant {args.variant}")
-    print(f"{'='*80}")
-    print(f"Test Accuracy: {metrics['test_accuracy']:.4f}")
-    print(f"Test AUC: {metrics['test_auc']:.4f}")
-    print(f"Test Brier: {metrics['test_brier']:.4f}")
+    for variant, metrics in all_metrics.items():
+        print(f"\n{'='*80}")
+        print(f"✅ TRAINING COMPLETE - Variant {variant}")
+        print(f"{'='*80}")
+        print(f"Test Accuracy: {metrics['test_accuracy']:.4f}")
+        print(f"Test AUC: {metrics['test_auc']:.4f}")
+        print(f"Test Brier: {metrics['test_brier']:.4f}")
 
 if __name__ == '__main__':
     main()
@@ -23,6 +23,7 @@ Usage:
 
 import argparse
 import json
+import sys
 import warnings
 from datetime import datetime
 from pathlib import Path
@@ -34,15 +35,17 @@ from sklearn.isotonic import IsotonicRegression
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import brier_score_loss, log_loss, roc_auc_score
 
+# Shared odds helpers live in ml/
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from markets_ncaabb import american_to_prob_array
+
 warnings.filterwarnings('ignore')
 
 
-def american_to_implied_prob(odds):
-    """Convert American odds to implied probability"""
-    if odds > 0:
-        return 100 / (odds + 100)
-    else:
-        return abs(odds) / (abs(odds) + 100)
+def bet_profit(american_odds, outcome):
+    """Per-unit profit of each bet: odds/100 on a win, -1 on a loss"""
+    odds = np.asarray(american_odds, dtype=np.float64)
+    return np.where(np.asarray(outcome) == 1, odds / 100, -1.0)
 
 
 def load_longdogs_data(input_path, min_odds=400, max_odds=2000):
@@ -52,19 +55,26 @@ def load_longdogs_data(input_path, min_odds=400, max_odds=2000):
     Returns:
         pd.DataFrame with columns: date, model_prob, outcome, american_odds
     """
-    df = pd.read_csv(input_path)
-    
-    # Filter by odds range
-    df = df[(df['american_odds'] >= min_odds) & (df['american_odds'] <= max_odds)].copy()
+    # Outcome is NaN for future games, so it loads as float and is cast after filtering
+    df = pd.read_csv(
+        input_path,
+        dtype={'american_odds': np.float64, 'model_prob': np.float64, 'outcome': np.float64},
+        parse_dates=['date']
+    )
     
-    # Remove rows without outcomes (future games)
-    df = df[df['outcome'].notna()].copy()
+    # Filter by odds range and remove rows without outcomes (future games)
+    # in a single pass so the frame is only copied once
+    mask = (
+        (df['american_odds'] >= min_odds)
+        & (df['american_odds'] <= max_odds)
+        & df['outcome'].notna()
+    )
+    df = df.loc[mask].copy()
     
     # Convert outcome to binary (1 = win, 0 = loss)
-    df['outcome'] = df['outcome'].astype(int)
+    df['outcome'] = df['outcome'].astype(np.int8)
     
     # Sort by date
-    df['date'] = pd.to_datetime(df['date'])
     df = df.sort_values('date')
     
     print(f"📊 Loaded {len(df)} longdog candidates")
@@ -84,8 +94,9 @@ def split_by_date(df, test_ratio=0.2):
     """
     split_idx = int(len(df) * (1 - test_ratio))
     
-    train_df = df.iloc[:split_idx].copy()
-    test_df = df.iloc[split_idx:].copy()
+    # Plain slices: nothing downstream modifies the splits in place
+    train_df = df.iloc[:split_idx]
+    test_df = df.iloc[split_idx:]
     
     print(f"\n📅 Chronological split:")
     print(f"   Train: {len(train_df)} games ({train_df['date'].min().date()} to {train_df['date'].max().date()})")
@@ -96,17 +107,61 @@ def split_by_date(df, test_ratio=0.2):
     return train_df, test_df
 
 
+def _fit_platt_1d(x, y, C=1.0, max_iter=25, tol=1e-10):
+    """
+    Fit a one-feature logistic regression by Newton's method (IRLS)
+    
+    Minimizes the same objective as sklearn's default LogisticRegression
+    (L2 penalty 1/(2C) on the coefficient, intercept unpenalized), but solves
+    the 2x2 Newton system directly instead of going through lbfgs.
+    
+    Returns:
+        (coefficient, intercept, number of Newton iterations)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    w, b = 0.0, 0.0
+    for n_iter in range(1, max_iter + 1):
+        # Clip the linear predictor so exp() can't overflow
+        p = 1.0 / (1.0 + np.exp(-np.clip(w * x + b, -90.0, 90.0)))
+        r = p - y
+        s = p * (1.0 - p)
+        grad = np.array([C * (r @ x) + w, C * r.sum()])
+        sx = s @ x
+        hess = np.array([[C * (s @ (x * x)) + 1.0, C * sx],
+                         [C * sx, C * s.sum()]])
+        step = np.linalg.solve(hess, grad)
+        w -= step[0]
+        b -= step[1]
+        if np.abs(step).max() < tol:
+            break
+    return w, b, n_iter
+
+
 def train_platt_scaling(train_df):
     """
     Train Platt scaling (logistic regression on model probabilities)
     
     Maps: p_model -> p_calibrated
+    
+    The two parameters are fit with _fit_platt_1d (Newton's method, not
+    lbfgs) and stored on a regular LogisticRegression, so the saved model
+    loads and predicts like before. n_iter_ holds the Newton iterations.
     """
-    X = train_df['model_prob'].values.reshape(-1, 1)
-    y = train_df['outcome'].values
+    y = train_df['outcome'].to_numpy()
+    classes = np.unique(y)
+    if len(classes) < 2:
+        raise ValueError(
+            f"Platt scaling needs both outcomes in the training set, got only {classes.tolist()}"
+        )
+    coef, intercept, n_iter = _fit_platt_1d(train_df['model_prob'].to_numpy(), y)
     
     platt = LogisticRegression(solver='lbfgs', max_iter=1000)
-    platt.fit(X, y)
+    platt.classes_ = classes
+    platt.coef_ = np.array([[coef]])
+    platt.intercept_ = np.array([intercept])
+    platt.n_features_in_ = 1
+    platt.n_iter_ = np.array([n_iter], dtype=np.int32)
     
     print(f"\n🔧 Platt Scaling Trained")
     print(f"   Coefficient: {platt.coef_[0][0]:.4f}")
@@ -121,8 +176,10 @@ def train_isotonic_regression(train_df):
     
     More flexible than Platt, doesn't assume logistic shape
     """
-    X = train_df['model_prob'].values
-    y = train_df['outcome'].values
+    # Hand sklearn contiguous float64 arrays so fit doesn't have to convert
+    # the int8 outcome column itself
+    X = train_df['model_prob'].to_numpy(dtype=np.float64)
+    y = train_df['outcome'].to_numpy(dtype=np.float64)
     
     isotonic = IsotonicRegression(out_of_bounds='clip')
     isotonic.fit(X, y)
@@ -135,7 +192,7 @@ def train_isotonic_regression(train_df):
     return isotonic
 
 
-def evaluate_calibration(df, model, model_type='platt'):
+def evaluate_calibration(df, model, model_type='platt', auc=None):
     """
     Evaluate calibration model on train or test set
     
@@ -144,45 +201,44 @@ def evaluate_calibration(df, model, model_type='platt'):
     - Brier score (calibration + discrimination)
     - Log loss (probabilistic accuracy)
     - ROI (betting profitability)
+    
+    Args:
+        auc: Precomputed AUC to report instead of recomputing it, for
+            calibrators that preserve the ranking of model_prob
     """
-    X = df['model_prob'].values
+    X = df['model_prob'].to_numpy(dtype=np.float64)
     y = df['outcome'].values
     
-    # Get calibrated probabilities
+    # Get calibrated probabilities straight from the fitted parameters,
+    # skipping sklearn's per-call input validation
     if model_type == 'platt':
-        p_calibrated = model.predict_proba(X.reshape(-1, 1))[:, 1]
-    else:  # isotonic
-        p_calibrated = model.predict(X)
+        p_calibrated = 1.0 / (1.0 + np.exp(-(model.coef_[0, 0] * X + model.intercept_[0])))
+    else:  # isotonic (out_of_bounds='clip', which np.interp does at the ends)
+        p_calibrated = np.interp(X, model.X_thresholds_, model.y_thresholds_)
     
     # Compute metrics
-    auc = roc_auc_score(y, p_calibrated)
+    if auc is None:
+        auc = roc_auc_score(y, p_calibrated)
     brier = brier_score_loss(y, p_calibrated)
     logloss = log_loss(y, p_calibrated)
     
     # Compute ROI (if we bet all these)
-    df_eval = df.copy()
-    df_eval['p_calibrated'] = p_calibrated
-    df_eval['p_market'] = df_eval['american_odds'].apply(american_to_implied_prob)
-    df_eval['calibrated_edge'] = df_eval['p_calibrated'] - df_eval['p_market']
+    odds = df['american_odds'].to_numpy()
+    calibrated_edge = p_calibrated - american_to_prob_array(odds)
     
     # Only bet when calibrated model sees positive edge
-    bets = df_eval[df_eval['calibrated_edge'] > 0].copy()
+    bet_mask = calibrated_edge > 0
+    total_bets = int(bet_mask.sum())
     
-    if len(bets) > 0:
+    if total_bets > 0:
         # Profit calculation (American odds)
-        bets['profit'] = bets.apply(
-            lambda row: row['american_odds'] / 100 if row['outcome'] == 1 else -1,
-            axis=1
-        )
-        
-        total_profit = bets['profit'].sum()
-        total_bets = len(bets)
+        bet_outcomes = y[bet_mask]
+        total_profit = bet_profit(odds[bet_mask], bet_outcomes).sum()
         roi = (total_profit / total_bets) * 100
         
-        num_wins = bets['outcome'].sum()
+        num_wins = int(bet_outcomes.sum())
         win_rate = num_wins / total_bets
     else:
-        total_bets = 0
         num_wins = 0
         win_rate = 0
         roi = 0
@@ -275,7 +331,11 @@ def save_calibration_models(platt, isotonic, train_df, test_metrics_platt,
         },
         'platt_params': {
             'coefficient': float(platt.coef_[0][0]),
-            'intercept': float(platt.intercept_[0])
+            'intercept': float(platt.intercept_[0]),
+            # Solved directly by _fit_platt_1d; the LogisticRegression
+            # wrapper's solver setting was never used
+            'fit_method': 'newton',
+            'n_iter': int(platt.n_iter_[0])
         },
         'isotonic_params': {
             'num_thresholds': len(isotonic.X_thresholds_),
@@ -374,7 +434,14 @@ Examples:
     print("Test Set Evaluation (Unseen Data)")
     print("="*60)
     
-    test_metrics_platt = evaluate_calibration(test_df, platt, 'platt')
+    # AUC only depends on how predictions rank. Platt with a positive
+    # coefficient is a strictly increasing map of model_prob, so its AUC is the
+    # raw model's AUC. Isotonic is only non-decreasing: its flat steps create
+    # ties, so it always gets its own AUC.
+    test_auc_raw = roc_auc_score(test_df['outcome'], test_df['model_prob'])
+    platt_auc = test_auc_raw if platt.coef_[0, 0] > 0 else None
+    
+    test_metrics_platt = evaluate_calibration(test_df, platt, 'platt', auc=platt_auc)
     print_metrics(test_metrics_platt, 'Platt Scaling (Test)')
     
     test_metrics_isotonic = evaluate_calibration(test_df, isotonic, 'isotonic')
@@ -387,22 +454,20 @@ Examples:
     
     # Use model_prob directly as "predictions"
     test_df_baseline = test_df.copy()
-    test_df_baseline['p_market'] = test_df_baseline['american_odds'].apply(american_to_implied_prob)
+    test_df_baseline['p_market'] = american_to_prob_array(test_df_baseline['american_odds'].to_numpy())
     test_df_baseline['uncalibrated_edge'] = test_df_baseline['model_prob'] - test_df_baseline['p_market']
     
     baseline_bets = test_df_baseline[test_df_baseline['uncalibrated_edge'] > 0].copy()
     
     if len(baseline_bets) > 0:
-        baseline_bets['profit'] = baseline_bets.apply(
-            lambda row: row['american_odds'] / 100 if row['outcome'] == 1 else -1,
-            axis=1
-        )
+        baseline_bets['profit'] = bet_profit(baseline_bets['american_odds'], baseline_bets['outcome'])
         baseline_roi = (baseline_bets['profit'].sum() / len(baseline_bets)) * 100
         baseline_win_rate = baseline_bets['outcome'].mean()
     else:
         baseline_roi = 0
         baseline_win_rate = 0
     
+    print(f"AUC:         {test_auc_raw:.4f}")
     print(f"Total Bets:  {len(baseline_bets)}")
     print(f"Win Rate:    {baseline_win_rate:.1%}")
     print(f"ROI:         {baseline_roi:+.2f}%")
@@ -34,104 +34,178 @@ def estimate_possessions(points: int, fga: int, fta: int, oreb: int, tov: int) -
         # Fallback: assume average pace of ~70 possessions per team
         return 70.0
 
+def _column_values(df: pd.DataFrame, col: str, default: float) -> np.ndarray:
+    """Column as a float64 array, or `default` for every row if the column is absent."""
+    if col in df.columns:
+        return df[col].to_numpy(dtype=np.float64)
+    return np.full(len(df), default)
+
+# Per-game metrics and their rolling means are stored as float32: they are
+# points/possession-scale numbers, so the extra float64 precision buys nothing
+STAT_DTYPE = np.float32
+
+# Per-game metrics that get rolling windows, and the prefix used for their output columns
+ROLLING_METRICS = [('ORtg', 'ORtg'), ('DRtg', 'DRtg'), ('Pace', 'Pace'), ('MoV', 'MoV'), ('won', 'WinPct')]
+
+# Matchup features: (name, home-side column, away-side column)
+MATCHUP_DIFFS = [
+    ('ORtg_vs_DRtg_L5', 'ORtg_L5_home', 'DRtg_L5_away'),
+    ('Pace_diff_L5', 'Pace_L5_home', 'Pace_L5_away'),
+    ('MoV_diff_L5', 'MoV_L5_home', 'MoV_L5_away'),
+    ('Form_diff_L5', 'WinPct_L5_home', 'WinPct_L5_away')
+]
+
+def _prior_rolling_means(
+    values: np.ndarray,
+    seg_start: np.ndarray,
+    windows: List[int],
+    dtype=np.float64
+) -> Dict[int, np.ndarray]:
+    """
+    Lookahead-free rolling means for several columns and windows at once.
+    
+    Equivalent to ``col.shift(1).rolling(window, min_periods=1).mean()`` run
+    on every column of `values` within each contiguous segment (one team's
+    games, sorted by date), but computed from a single set of prefix sums
+    instead of one rolling pass per column and window.
+    
+    Args:
+        values: (n, k) array of per-game metrics, NaN for missing
+        seg_start: (n,) row index where each row's segment begins
+        windows: Window sizes
+        dtype: Output dtype (sums are always accumulated in float64)
+    
+    Returns:
+        Dict mapping window -> (n, k) array of rolling means (NaN where no prior games)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    n, k = values.shape
+    
+    missing = np.isnan(values)
+    csum = np.zeros((n + 1, k))
+    np.cumsum(np.where(missing, 0.0, values), axis=0, out=csum[1:])
+    ccount = np.zeros((n + 1, k))
+    np.cumsum(~missing, axis=0, out=ccount[1:])
+    
+    # Prior games for row i are rows [max(i - window, seg_start), i)
+    hi = np.arange(n)
+    means = {}
+    for window in windows:
+        lo = np.maximum(hi - window, seg_start)
+        count = ccount[hi] - ccount[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[window] = np.where(count > 0, (csum[hi] - csum[lo]) / count, np.nan).astype(dtype)
+    return means
+
+def _segment_starts(keys: np.ndarray) -> np.ndarray:
+    """For pre-sorted keys, the row index where each row's run of equal keys begins."""
+    keys = np.asarray(keys)
+    n = len(keys)
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = keys[1:] != keys[:-1]
+    return np.maximum.accumulate(np.where(is_start, np.arange(n), 0))
+
+def _home_away_positions(is_home: pd.Series) -> Dict[bool, np.ndarray]:
+    """Row positions of home (True) and away (False) team-games, from one pass over is_home."""
+    flags = is_home.to_numpy(dtype=bool)
+    return {True: np.flatnonzero(flags), False: np.flatnonzero(~flags)}
+
 def compute_team_rolling_stats(
     team_games: pd.DataFrame,
     lookback_windows: List[int] = [3, 5, 10]
 ) -> pd.DataFrame:
     """
-    Compute rolling statistics for a single team.
+    Compute rolling statistics for one team, or for many teams in one pass.
     
     Args:
-        team_games: DataFrame with games for one team, sorted by date
+        team_games: DataFrame of team-games. If it has a 'team' column, stats
+            are computed independently per team; otherwise all rows are
+            treated as one team's games.
             Required columns: date, points_for, points_against, won, is_home
             Optional: fga, fta, oreb, tov (for better possession estimates)
         lookback_windows: List of window sizes for rolling stats
     
     Returns:
-        DataFrame with rolling stats added for each game
+        DataFrame with rolling stats added for each game, sorted by team and date
     """
-    team_games = team_games.sort_values('date').copy()
+    # Group and sort on int32 team codes rather than hashing/comparing team
+    # name strings. Codes follow sorted name order, so the (team, date) sort
+    # is unchanged.
+    has_team = 'team' in team_games.columns
+    if has_team:
+        team_codes, _ = pd.factorize(team_games['team'], sort=True, use_na_sentinel=False)
+        order = np.lexsort((team_games['date'].to_numpy(), team_codes))
+        team_games = team_games.take(order).reset_index(drop=True)
+        team_codes = team_codes[order].astype(np.int32)
+    else:
+        team_games = team_games.sort_values('date', kind='mergesort').reset_index(drop=True)
+        team_codes = np.zeros(len(team_games), dtype=np.int32)
+    seg_start = _segment_starts(team_codes)
     
-    # Estimate possessions
+    # Estimate possessions (vectorized estimate_possessions)
     if 'fga' in team_games.columns:
-        team_games['possessions'] = team_games.apply(
-            lambda row: estimate_possessions(
-                row['points_for'], 
-                row.get('fga', np.nan),
-                row.get('fta', np.nan), 
-                row.get('oreb', 0),
-                row.get('tov', 0)
-            ), axis=1
-        )
+        fga = _column_values(team_games, 'fga', np.nan)
+        fta = _column_values(team_games, 'fta', np.nan)
+        oreb = _column_values(team_games, 'oreb', 0.0)
+        tov = _column_values(team_games, 'tov', 0.0)
+        team_games['possessions'] = np.where(
+            np.isnan(fga) | np.isnan(fta), 70.0, fga + 0.44 * fta - oreb + tov
+        ).astype(STAT_DTYPE)
     else:
         # Simplified: assume ~70 poss/game
-        team_games['possessions'] = 70.0
+        team_games['possessions'] = np.full(len(team_games), 70.0, dtype=STAT_DTYPE)
+    
+    # Compute per-possession metrics in float32, writing each result into
+    # its own buffer rather than allocating a temporary per operation
+    points_for = team_games['points_for'].to_numpy(dtype=STAT_DTYPE, na_value=np.nan)
+    points_against = team_games['points_against'].to_numpy(dtype=STAT_DTYPE, na_value=np.nan)
+    possessions = team_games['possessions'].to_numpy()
+    
+    ortg = np.divide(points_for, possessions)
+    np.multiply(ortg, 100.0, out=ortg)
+    drtg = np.divide(points_against, possessions)
+    np.multiply(drtg, 100.0, out=drtg)
     
-    # Compute per-possession metrics
-    team_games['ORtg'] = (team_games['points_for'] / team_games['possessions']) * 100
-    team_games['DRtg'] = (team_games['points_against'] / team_games['possessions']) * 100
+    team_games['ORtg'] = ortg
+    team_games['DRtg'] = drtg
     team_games['Pace'] = team_games['possessions']
-    team_games['MoV'] = team_games['points_for'] - team_games['points_against']
+    team_games['MoV'] = np.subtract(points_for, points_against)
     
     # Compute rolling stats for each window
-    for window in lookback_windows:
-        # Offensive rating
-        team_games[f'ORtg_L{window}'] = (
-            team_games['ORtg'].shift(1).rolling(window=window, min_periods=1).mean()
-        )
-        
-        # Defensive rating
-        team_games[f'DRtg_L{window}'] = (
-            team_games['DRtg'].shift(1).rolling(window=window, min_periods=1).mean()
-        )
-        
-        # Pace
-        team_games[f'Pace_L{window}'] = (
-            team_games['Pace'].shift(1).rolling(window=window, min_periods=1).mean()
-        )
-        
-        # Margin of victory
-        team_games[f'MoV_L{window}'] = (
-            team_games['MoV'].shift(1).rolling(window=window, min_periods=1).mean()
-        )
-        
-        # Win percentage
-        team_games[f'WinPct_L{window}'] = (
-            team_games['won'].shift(1).rolling(window=window, min_periods=1).mean()
-        )
-    
-    # Home/away splits (last 5 games at home or away)
+    metric_values = team_games[[col for col, _ in ROLLING_METRICS]].to_numpy(dtype=np.float64)
+    rolling = _prior_rolling_means(
+        metric_values, seg_start, lookback_windows, dtype=STAT_DTYPE
+    )
+    # Attach every window's columns in one concat rather than one insert each
+    rolling_cols = {
+        f'{name}_L{window}': rolling[window][:, j]
+        for window in lookback_windows
+        for j, (_, name) in enumerate(ROLLING_METRICS)
+    }
+    team_games = pd.concat([team_games, pd.DataFrame(rolling_cols, index=team_games.index)], axis=1)
+    
+    # Home/away splits (last 5 games at home or away). Each split is rolled
+    # over its own rows and scattered back by position; rows on the other
+    # side stay NaN.
     if 'is_home' in team_games.columns:
-        home_games = team_games[team_games['is_home'] == True].copy()
-        away_games = team_games[team_games['is_home'] == False].copy()
-        
-        # Compute splits
-        home_games['ORtg_at_home_L5'] = (
-            home_games['ORtg'].shift(1).rolling(window=5, min_periods=1).mean()
-        )
-        home_games['DRtg_at_home_L5'] = (
-            home_games['DRtg'].shift(1).rolling(window=5, min_periods=1).mean()
-        )
-        
-        away_games['ORtg_on_road_L5'] = (
-            away_games['ORtg'].shift(1).rolling(window=5, min_periods=1).mean()
-        )
-        away_games['DRtg_on_road_L5'] = (
-            away_games['DRtg'].shift(1).rolling(window=5, min_periods=1).mean()
-        )
-        
-        # Merge splits back
-        team_games = team_games.merge(
-            home_games[['date', 'ORtg_at_home_L5', 'DRtg_at_home_L5']],
-            on='date', how='left'
-        )
-        team_games = team_games.merge(
-            away_games[['date', 'ORtg_on_road_L5', 'DRtg_on_road_L5']],
-            on='date', how='left'
-        )
+        home_mask = team_games['is_home'].to_numpy(dtype=bool)
+        for is_home, split_name in [(True, 'at_home'), (False, 'on_road')]:
+            rows = np.flatnonzero(home_mask == is_home)
+            split_starts = _segment_starts(team_codes[rows])
+            split_means = np.full((len(team_games), 2), np.nan, dtype=STAT_DTYPE)
+            split_means[rows] = _prior_rolling_means(
+                metric_values[rows, :2], split_starts, [5], dtype=STAT_DTYPE
+            )[5]
+            team_games[f'ORtg_{split_name}_L5'] = split_means[:, 0]
+            team_games[f'DRtg_{split_name}_L5'] = split_means[:, 1]
     
     # Games played (for time decay features)
-    team_games['games_played'] = range(len(team_games))
+    games_played = np.arange(len(team_games), dtype=np.int32)
+    if has_team:
+        games_played -= seg_start.astype(np.int32)
+    team_games['games_played'] = games_played
     
     return team_games
 
@@ -161,63 +235,71 @@ def build_inseason_stats(
     print(f"Total games: {len(results_df)}")
     print(f"Date range: {results_df['date'].min().date()} → {results_df['date'].max().date()}")
     
-    # Reshape to team-centric view
-    home_games = results_df.copy()
-    home_games['team'] = home_games['home_team']
-    home_games['opponent'] = home_games['away_team']
-    home_games['points_for'] = home_games['home_score']
-    home_games['points_against'] = home_games['away_score']
-    home_games['won'] = (home_games['home_score'] > home_games['away_score']).astype(int)
-    home_games['is_home'] = True
-    
-    away_games = results_df.copy()
-    away_games['team'] = away_games['away_team']
-    away_games['opponent'] = away_games['home_team']
-    away_games['points_for'] = away_games['away_score']
-    away_games['points_against'] = away_games['home_score']
-    away_games['won'] = (away_games['away_score'] > away_games['home_score']).astype(int)
-    away_games['is_home'] = False
-    
-    # Combine
-    all_team_games = pd.concat([home_games, away_games], ignore_index=True)
-    all_team_games = all_team_games.sort_values(['team', 'date'])
-    
-    # Compute rolling stats per team
+    # Store team names as one shared categorical so grouping, sorting and the
+    # joins below work on integer codes
+    team_names = pd.concat([results_df['home_team'], results_df['away_team']]).dropna().unique()
+    team_dtype = pd.CategoricalDtype(categories=np.sort(team_names.astype(str)))
+    results_df['home_team'] = results_df['home_team'].astype(team_dtype)
+    results_df['away_team'] = results_df['away_team'].astype(team_dtype)
+    
+    # Reshape to team-centric view: home rows followed by away rows, built
+    # directly from column arrays instead of two full copies of results_df
+    n_games = len(results_df)
+    dates = results_df['date'].to_numpy()
+    home_team = results_df['home_team'].cat.codes.to_numpy()
+    away_team = results_df['away_team'].cat.codes.to_numpy()
+    home_score = results_df['home_score'].to_numpy()
+    away_score = results_df['away_score'].to_numpy()
+    
+    all_team_games = pd.DataFrame({
+        'date': np.concatenate([dates, dates]),
+        'team': pd.Categorical.from_codes(np.concatenate([home_team, away_team]), dtype=team_dtype),
+        'opponent': pd.Categorical.from_codes(np.concatenate([away_team, home_team]), dtype=team_dtype),
+        'points_for': np.concatenate([home_score, away_score]),
+        'points_against': np.concatenate([away_score, home_score]),
+        'won': np.concatenate([home_score > away_score, away_score > home_score]).astype(np.int8),
+        'is_home': np.concatenate([np.ones(n_games, dtype=bool), np.zeros(n_games, dtype=bool)])
+    })
+    
+    # Carry box-score columns through for compute_team_rolling_stats' possession estimate
+    for col in ('fga', 'fta', 'oreb', 'tov'):
+        if col in results_df.columns:
+            values = results_df[col].to_numpy()
+            all_team_games[col] = np.concatenate([values, values])
+    
+    # Compute rolling stats for all teams in one pass
     print(f"\nComputing rolling stats for {all_team_games['team'].nunique()} teams...")
-    
-    team_stats_list = []
-    for team in all_team_games['team'].unique():
-        team_games = all_team_games[all_team_games['team'] == team].copy()
-        team_stats = compute_team_rolling_stats(team_games, lookback_windows)
-        team_stats_list.append(team_stats)
-    
-    all_stats = pd.concat(team_stats_list, ignore_index=True)
+    all_stats = compute_team_rolling_stats(all_team_games, lookback_windows)
     
     print(f"✅ Rolling stats computed for all teams")
     
     # Merge back to original game structure
     print("\nMerging stats back to games...")
     
-    # Home team stats
+    # Index each side's stats by (date, team) once and join on that index,
+    # rather than hash-merging on columns
     home_stat_cols = [col for col in all_stats.columns if col.startswith(('ORtg_', 'DRtg_', 'Pace_', 'MoV_', 'WinPct_', 'games_played'))]
-    home_stats = all_stats[all_stats['is_home'] == True][['date', 'team'] + home_stat_cols].copy()
-    home_stats = home_stats.rename(columns={col: f'{col}_home' if not col in ['date', 'team'] else col for col in home_stats.columns})
-    home_stats = home_stats.rename(columns={'team': 'home_team'})
-    
-    # Away team stats
-    away_stats = all_stats[all_stats['is_home'] == False][['date', 'team'] + home_stat_cols].copy()
-    away_stats = away_stats.rename(columns={col: f'{col}_away' if not col in ['date', 'team'] else col for col in away_stats.columns})
-    away_stats = away_stats.rename(columns={'team': 'away_team'})
-    
-    # Merge
-    merged = results_df.merge(home_stats, on=['date', 'home_team'], how='left')
-    merged = merged.merge(away_stats, on=['date', 'away_team'], how='left')
-    
-    # Compute matchup features
-    merged['ORtg_vs_DRtg_L5'] = merged['ORtg_L5_home'] - merged['DRtg_L5_away']
-    merged['Pace_diff_L5'] = merged['Pace_L5_home'] - merged['Pace_L5_away']
-    merged['MoV_diff_L5'] = merged['MoV_L5_home'] - merged['MoV_L5_away']
-    merged['Form_diff_L5'] = merged['WinPct_L5_home'] - merged['WinPct_L5_away']
+    side_positions = _home_away_positions(all_stats['is_home'])
+    side_stats = {
+        side: all_stats.iloc[side_positions[is_home]]
+            .set_index(['date', 'team'])[home_stat_cols]
+            .add_suffix(f'_{side}')
+        for is_home, side in [(True, 'home'), (False, 'away')]
+    }
+    
+    merged = (
+        results_df
+        .join(side_stats['home'], on=['date', 'home_team'])
+        .join(side_stats['away'], on=['date', 'away_team'])
+        .reset_index(drop=True)
+    )
+    
+    # Compute matchup features (home column minus away column) in one subtraction
+    home_arr = merged[[home for _, home, _ in MATCHUP_DIFFS]].to_numpy(dtype=STAT_DTYPE)
+    away_arr = merged[[away for _, _, away in MATCHUP_DIFFS]].to_numpy(dtype=STAT_DTYPE)
+    diffs = home_arr - away_arr
+    for j, (name, _, _) in enumerate(MATCHUP_DIFFS):
+        merged[name] = diffs[:, j]
     
     # Count features available
     inseason_cols = [col for col in merged.columns if any(
@@ -247,7 +329,12 @@ def main():
         return
     
     print(f"Loading results from: {results_file}")
-    results_df = pd.read_csv(results_file)
+    # Scores are NaN for unplayed games, so they load as float32 rather than int
+    results_df = pd.read_csv(
+        results_file,
+        dtype={'home_score': np.float32, 'away_score': np.float32},
+        parse_dates=['game_day']
+    )
     
     # Use game_day as date column (walkforward results use this)
     if 'game_day' in results_df.columns:
@@ -64,39 +64,62 @@ def build_features(df: pd.DataFrame, include_target: bool = True) -> Tuple[pd.Da
         - turnover_creation_vs_allowed
         - experience_coaching_metrics
     """
-    df = df.copy()
-    
     # ============================================================
     # PARSE GAME RESULTS (if available)
     # ============================================================
+    # Kept as a local Series rather than written back, so the caller's
+    # frame is never mutated and no defensive copy of it is needed
+    margin = df['margin'] if 'margin' in df.columns else None
     if include_target and 'game_result' in df.columns:
-        results = df['game_result'].apply(parse_game_result)
-        df['did_win'] = results.apply(lambda x: x[0])
-        df['team_score'] = results.apply(lambda x: x[1])
-        df['opp_score'] = results.apply(lambda x: x[2])
-        df['margin'] = df['team_score'] - df['opp_score']
+        # Same parse as parse_game_result(), run over the whole column at once
+        results = df['game_result'].str.strip().str.extract(r'^([WL])\s+(\d+)-(\d+)')
+        margin = pd.to_numeric(results[1]) - pd.to_numeric(results[2])
+    
+    # ============================================================
+    # FILTER TO COMPLETE ROWS
+    # ============================================================
+    # Every feature below is built from these KenPom columns (plus a
+    # constant), so checking them once up front is enough, and the
+    # derived features are only computed for rows that are kept
+    base_cols = [
+        'AdjEM_team', 'AdjEM_opp', 'AdjOE_team', 'AdjOE_opp',
+        'AdjDE_team', 'AdjDE_opp', 'AdjTempo_team', 'AdjTempo_opp',
+        'SOS_team', 'SOS_opp', 'Luck_team', 'Luck_opp',
+        'RankAdjEM_team', 'RankAdjEM_opp',
+    ]
+    complete_mask = np.isfinite(df[base_cols].to_numpy(dtype=np.float64)).all(axis=1)
+    
+    if include_target:
+        complete_mask &= margin.notna().to_numpy()
+    
+    df = df[complete_mask]
+    col = {c: df[c].to_numpy(dtype=np.float64) for c in base_cols}
     
     # ============================================================
     # CORE KENPOM FEATURES
     # ============================================================
     
+    # Built as plain arrays and turned into the feature frame in one go,
+    # rather than written into df one column at a time
+    derived = {}
+    
     # These may already be in the merged data, but recalculate for clarity
-    df['efficiency_diff'] = df['AdjEM_team'] - df['AdjEM_opp']
-    df['offensive_matchup'] = df['AdjOE_team'] - df['AdjDE_opp']
-    df['defensive_matchup'] = df['AdjDE_team'] - df['AdjOE_opp']
-    df['tempo_diff'] = df['AdjTempo_team'] - df['AdjTempo_opp']
+    derived['efficiency_diff'] = col['AdjEM_team'] - col['AdjEM_opp']
+    derived['offensive_matchup'] = col['AdjOE_team'] - col['AdjDE_opp']
+    derived['defensive_matchup'] = col['AdjDE_team'] - col['AdjOE_opp']
+    derived['tempo_diff'] = col['AdjTempo_team'] - col['AdjTempo_opp']
     
     # Strength of schedule differential
-    df['sos_diff'] = df['SOS_team'] - df['SOS_opp']
+    derived['sos_diff'] = col['SOS_team'] - col['SOS_opp']
     
     # Luck differential (measures overperformance vs expected W-L)
-    df['luck_diff'] = df['Luck_team'] - df['Luck_opp']
+    derived['luck_diff'] = col['Luck_team'] - col['Luck_opp']
     
     # Absolute tempo (average pace)
-    df['avg_tempo'] = (df['AdjTempo_team'] + df['AdjTempo_opp']) / 2
+    derived['avg_tempo'] = (col['AdjTempo_team'] + col['AdjTempo_opp']) / 2
     
     # Team efficiency ranks (lower is better)
-    df['rank_diff'] = df['RankAdjEM_team'] - df['RankAdjEM_opp']
+    derived['rank_diff'] = col['RankAdjEM_team'] - col['RankAdjEM_opp']
     
     # ============================================================
     # HOME COURT ADVANTAGE
@@ -104,17 +127,17 @@ def build_features(df: pd.DataFrame, include_target: bool = True) -> Tuple[pd.Da
     # TODO: Implement proper home/away detection
     # For now, assume team is home by default (neutral games will need refinement)
     # Ideally, parse location from ESPN data or add explicit home/away flag
-    df['home_flag'] = 1  # Placeholder: assume all games are home for team
+    derived['home_flag'] = np.ones(len(df))  # Placeholder: assume all games are home for team
     
     # ============================================================
     # INTERACTION FEATURES
     # ============================================================
     
     # Efficiency advantage × tempo (high tempo amplifies efficiency gaps)
-    df['efficiency_x_tempo'] = df['efficiency_diff'] * df['avg_tempo']
+    derived['efficiency_x_tempo'] = derived['efficiency_diff'] * derived['avg_tempo']
     
     # Offensive advantage × defensive advantage (total matchup quality)
-    df['matchup_product'] = df['offensive_matchup'] * df['defensive_matchup']
+    derived['matchup_product'] = derived['offensive_matchup'] * derived['defensive_matchup']
     
     # ============================================================
     # TODO: ADVANCED FEATURES (Phase 2+)
@@ -147,19 +170,16 @@ def build_features(df: pd.DataFrame, include_target: bool = True) -> Tuple[pd.Da
         'matchup_product',
     ]
     
-    # Filter to rows with complete data
-    complete_mask = df[feature_cols].notna().all(axis=1)
-    
-    if include_target:
-        complete_mask &= df['margin'].notna()
-    
-    df_clean = df[complete_mask].copy()
-    
-    X = df_clean[feature_cols]
+    # float32 halves the matrix size; the tree models cast X to float32
+    # internally anyway, so predictions are unchanged
+    X = pd.DataFrame(
+        {c: derived[c].astype(np.float32) for c in feature_cols},
+        index=df.index,
+    )
     
     if include_target:
-        y_margin = df_clean['margin']
-        y_win = (df_clean['margin'] > 0).astype(int)
+        y_margin = margin[complete_mask].rename('margin')
+        y_win = (y_margin > 0).astype(int)
     else:
         y_margin = None
         y_win = None
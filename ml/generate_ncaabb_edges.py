@@ -8,7 +8,7 @@ This script:
 3. Loads market odds data (spreads, moneylines)
 4. Generates model predictions
 5. Calculates edges (model vs market)
-6. Outputs edges to CSV for backtesting
+6. Outputs edges to CSV (or Parquet) for backtesting
 
 Usage:
     python3 ml/generate_ncaabb_edges.py \
@@ -31,13 +31,16 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 import joblib
+from scipy.special import expit
+from sklearn.ensemble import GradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
 
 # Add ml/ to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils import load_all_merged_data
 from features_ncaabb import build_features
-from markets_ncaabb import load_markets, join_markets_with_merged, calculate_market_edge
+from markets_ncaabb import load_markets, join_markets_with_merged
 
 
 def load_models(model_dir: Path) -> tuple:
@@ -85,21 +88,34 @@ def generate_predictions(
         feature_cols: List of feature column names
         
     Returns:
-        DataFrame with added prediction columns:
+        df, with prediction columns added in place:
             - model_spread: Predicted margin from home (team) perspective
             - model_home_prob: Predicted win probability for home team
             - model_away_prob: 1 - model_home_prob
     """
-    df = df.copy()
-    
-    X = df[feature_cols]
+    # float32, C-contiguous matches what the tree models convert to
+    # internally, so both models' input validation can use this buffer
+    # without copying it. X stays a DataFrame (wrapping the array, not
+    # copying it) because the models were fitted with feature names.
+    X = pd.DataFrame(
+        np.ascontiguousarray(df[feature_cols].to_numpy(dtype=np.float32)),
+        index=df.index,
+        columns=feature_cols,
+        copy=False,
+    )
     
     # Spread predictions
     df['model_spread'] = spread_model.predict(X)
     
-    # Moneyline predictions (probability of home team winning)
-    df['model_home_prob'] = ml_model.predict_proba(X)[:, 1]
-    df['model_away_prob'] = 1 - df['model_home_prob']
+    # Moneyline predictions (probability of home team winning). For binary
+    # boosting/logistic models predict_proba is just expit of the decision
+    # function stacked as [1 - p, p], so take p directly
+    if isinstance(ml_model, (GradientBoostingClassifier, LogisticRegression)) and len(ml_model.classes_) == 2:
+        model_home_prob = expit(ml_model.decision_function(X))
+    else:
+        model_home_prob = ml_model.predict_proba(X)[:, 1]
+    df['model_home_prob'] = model_home_prob
+    df['model_away_prob'] = 1 - model_home_prob
     
     print(f"✅ Generated predictions for {len(df):,} games")
     print(f"   Spread range: [{df['model_spread'].min():.1f}, {df['model_spread'].max():.1f}]")
@@ -116,36 +132,46 @@ def calculate_all_edges(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with model predictions and market data
         
     Returns:
-        DataFrame with added edge columns:
+        df, with edge columns added in place:
             - edge_spread: Model spread - market spread
             - home_ml_edge: Model home prob - market home implied prob
             - away_ml_edge: Model away prob - market away implied prob
             - best_bet: Recommended bet type
             - max_edge: Maximum edge value
     """
-    df = df.copy()
-    
-    # Vectorized edge calculations
-    df['edge_spread'] = df['model_spread'] - df['close_spread']
-    df['home_ml_edge'] = df['model_home_prob'] - df['home_implied_prob']
-    df['away_ml_edge'] = df['model_away_prob'] - df['away_implied_prob']
-    
-    # Determine best bet for each game
-    # (This is a simplified version; calculate_market_edge() has more logic)
-    edges_dict = []
-    for _, row in df.iterrows():
-        edge_info = calculate_market_edge(
-            model_spread=row['model_spread'],
-            close_spread=row['close_spread'],
-            model_win_prob=row['model_home_prob'],
-            home_implied_prob=row['home_implied_prob'],
-            away_implied_prob=row['away_implied_prob']
-        )
-        edges_dict.append(edge_info)
-    
-    edge_df = pd.DataFrame(edges_dict)
-    df['best_bet'] = edge_df['best_bet']
-    df['max_edge'] = edge_df['max_edge']
+    # Vectorized edge calculations, done once on arrays and shared by the
+    # edge columns and the best-bet selection below
+    def column(col):
+        return df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    edge_spread = column('model_spread') - column('close_spread')
+    home_edge = column('model_home_prob') - column('home_implied_prob')
+    away_edge = column('model_away_prob') - column('away_implied_prob')
+    df['edge_spread'] = edge_spread
+    df['home_ml_edge'] = home_edge
+    df['away_ml_edge'] = away_edge
+    
+    # Determine best bet for each game, applying calculate_market_edge()'s
+    # rules to every row at once: a spread bet needs |edge| > 2 points, then
+    # home ML and away ML each take over only if their edge beats the current
+    # max. That is an argmax over the three candidates (first index wins
+    # ties, matching the strict comparisons), with missing edges never winning
+    spread_bet = np.abs(edge_spread) > 2
+    candidates = np.column_stack([
+        np.where(spread_bet, np.abs(edge_spread), 0.0),
+        np.where(np.isnan(home_edge), -np.inf, home_edge),
+        np.where(np.isnan(away_edge), -np.inf, away_edge),
+    ])
+    winner = candidates.argmax(axis=1)
+    max_edge = candidates[np.arange(len(candidates)), winner]
+    best_bet = np.select(
+        [winner == 1, winner == 2, spread_bet & (edge_spread > 0), spread_bet],
+        np.array(['home_ml', 'away_ml', 'home_spread', 'away_spread'], dtype=object),
+        default=None,
+    )
+    
+    df['best_bet'] = best_bet
+    df['max_edge'] = max_edge
     
     print(f"\n📊 Edge Distribution:")
     print(f"   Spread edge: μ={df['edge_spread'].mean():.2f}, σ={df['edge_spread'].std():.2f}")
@@ -188,7 +214,7 @@ def main():
         '--output-file',
         type=Path,
         required=True,
-        help="Path to output edges CSV"
+        help="Path to output edges CSV (a .parquet suffix writes Parquet instead)"
     )
     
     args = parser.parse_args()
@@ -219,9 +245,7 @@ def main():
     X, _, _ = build_features(joined_df)
     
     # Combine features back with original data
-    feature_df = joined_df.copy()
-    for col in X.columns:
-        feature_df[col] = X[col]
+    feature_df = joined_df.assign(**{col: X[col] for col in X.columns})
     
     # Get feature columns (same as used in training)
     feature_cols = [
@@ -242,9 +266,13 @@ def main():
     print(f"\n7️⃣ Calculating betting edges...")
     edge_df = calculate_all_edges(pred_df)
     
-    # 8. Save output
+    # 8. Save output. Parquet skips formatting every float as text (needs
+    # pyarrow or fastparquet installed); CSV stays the default
     args.output_file.parent.mkdir(parents=True, exist_ok=True)
-    edge_df.to_csv(args.output_file, index=False)
+    if args.output_file.suffix == '.parquet':
+        edge_df.to_parquet(args.output_file, index=False)
+    else:
+        edge_df.to_csv(args.output_file, index=False)
     
     print(f"\n✅ Saved {len(edge_df):,} games with edges to {args.output_file}")
     
@@ -42,6 +42,73 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Union
+import re
+import sys
+
+# Shared team-name helpers live next to this module
+sys.path.insert(0, str(Path(__file__).parent))
+from team_database import map_team_names
+
+
+# American odds -> implied probability for every whole-number line in
+# [-_ODDS_LUT_MAX, _ODDS_LUT_MAX] (moneylines cluster on a small set of
+# these), built with the same float64 formula as the fallback path
+_ODDS_LUT_MAX = 2000
+_LUT_ODDS = np.arange(-_ODDS_LUT_MAX, _ODDS_LUT_MAX + 1, dtype=np.float64)
+with np.errstate(divide='ignore'):
+    _ODDS_TO_PROB = np.where(_LUT_ODDS < 0, -_LUT_ODDS / (-_LUT_ODDS + 100), 100 / (_LUT_ODDS + 100))
+
+# Common mascots to remove (from The Odds API format)
+MASCOTS = [
+    'Aggies', 'Aztecs', 'Badgers', 'Bears', 'Bearcats', 'Bengals', 'Big Green',
+    'Billikens', 'Bison', 'Black Knights', 'Blackbirds', 'Blue Devils', 'Blue Raiders',
+    'Bobcats', 'Boilermakers', 'Braves', 'Broncos', 'Bruins', 'Buccaneers', 'Bulldogs',
+    'Bulls', 'Cardinals', 'Catamounts', 'Cavaliers', 'Chanticleers', 'Chippewas',
+    'Colonels', 'Commodores', 'Cougars', 'Cowboys', 'Crimson Tide', 'Crusaders',
+    'Cyclones', 'Demon Deacons', 'Dons', 'Ducks', 'Dukes', 'Eagles', 'Engineers',
+    'Explorers', 'Falcons', 'Fighting Hawks', 'Fighting Illini', 'Fighting Irish',
+    'Flames', 'Flyers', 'Friars', 'Gators', 'Gaels', 'Golden Bears', 'Golden Eagles',
+    'Golden Flashes', 'Golden Gophers', 'Golden Grizzlies', 'Golden Hurricane',
+    'Great Danes', 'Green Wave', 'Greyhounds', 'Grizzlies', 'Hawkeyes', 'Highlanders',
+    'Hilltoppers', 'Hokies', 'Hornets', 'Huskies', 'Hurricanes', 'Jaguars', 'Jaspers',
+    'Jayhawks', 'Knights', 'Lumberjacks', 'Lions', 'Lobos', 'Longhorns', 'Matadors',
+    'Mavericks', 'Mean Green', 'Midshipmen', 'Miners', 'Minutemen', 'Monarchs',
+    'Mountaineers', 'Musketeers', 'Mustangs', 'Nittany Lions', 'Norse', 'Orange',
+    'Orangemen', 'Owls', 'Panthers', 'Patriots', 'Peacocks', 'Penguins', 'Phoenix',
+    'Pirates', 'Pioneers', 'Ragin Cajuns', 'Raiders', 'Rams', 'Ramblers', 'Rattlers',
+    'Ravens', 'Razorbacks', 'Rebels', 'Red Flash', 'Red Raiders', 'Red Storm',
+    'Redbirds', 'Redhawks', 'Retrievers', 'Riverhawks', 'Roadrunners', 'Rockets',
+    'Runn Rebels', 'Running Rebels', 'Salukis', 'Scarlet Knights', 'Seahawks',
+    'Seawolves', 'Seminoles', 'Shockers', 'Skyhawks', 'Sooners', 'Spartans',
+    'Spiders', 'Stags', 'Sun Devils', 'Tar Heels', 'Terrapins', 'Terriers',
+    'Thunderbirds', 'Tigers', 'Titans', 'Trojans', 'Utes', 'Vandals', 'Vikings',
+    'Volunteers', 'Waves', 'Wildcats', 'Wolfpack', 'Wolverines', 'Wonders',
+    'Yellow Jackets', 'Zips', 'Screaming Eagles', 'Leathernecks', 'Riverhawks',
+    'Lopes', 'Hatters'
+]
+
+# One precompiled pattern for all mascots. Longer mascots are tried first, so
+# "Golden Bears" is stripped whole rather than leaving "... Golden".
+_MASCOT_RE = re.compile(
+    r' (?:' + '|'.join(map(re.escape, sorted(set(MASCOTS), key=len, reverse=True))) + r')$'
+)
+
+# School names that differ from ESPN's once the mascot is removed
+SPECIAL_CASES = {
+    'UConn': 'Connecticut',
+    'Miami (FL)': 'Miami',
+    'Miami (OH)': 'Miami (OH)',
+    "Saint Mary's (CA)": "Saint Mary's",
+    'Southern California': 'USC',
+    'Central Florida': 'UCF',
+    'Louisiana State': 'LSU',
+    'Texas Christian': 'TCU',
+    'Southern Methodist': 'SMU',
+    'Brigham Young': 'BYU',
+    'Texas-San Antonio': 'UTSA',
+    'Nevada-Las Vegas': 'UNLV',
+    'Mississippi': 'Ole Miss',
+}
 
 
 def normalize_odds_team_name(name: str) -> str:
@@ -57,62 +124,16 @@ def normalize_odds_team_name(name: str) -> str:
     Returns:
         Normalized team name matching ESPN format
     """
-    # Common mascots to remove (from The Odds API format)
-    mascots = [
-        'Aggies', 'Aztecs', 'Badgers', 'Bears', 'Bearcats', 'Bengals', 'Big Green',
-        'Billikens', 'Bison', 'Black Knights', 'Blackbirds', 'Blue Devils', 'Blue Raiders',
-        'Bobcats', 'Boilermakers', 'Braves', 'Broncos', 'Bruins', 'Buccaneers', 'Bulldogs',
-        'Bulls', 'Cardinals', 'Catamounts', 'Cavaliers', 'Chanticleers', 'Chippewas',
-        'Colonels', 'Commodores', 'Cougars', 'Cowboys', 'Crimson Tide', 'Crusaders',
-        'Cyclones', 'Demon Deacons', 'Dons', 'Ducks', 'Dukes', 'Eagles', 'Engineers',
-        'Explorers', 'Falcons', 'Fighting Hawks', 'Fighting Illini', 'Fighting Irish',
-        'Flames', 'Flyers', 'Friars', 'Gators', 'Gaels', 'Golden Bears', 'Golden Eagles',
-        'Golden Flashes', 'Golden Gophers', 'Golden Grizzlies', 'Golden Hurricane',
-        'Great Danes', 'Green Wave', 'Greyhounds', 'Grizzlies', 'Hawkeyes', 'Highlanders',
-        'Hilltoppers', 'Hokies', 'Hornets', 'Huskies', 'Hurricanes', 'Jaguars', 'Jaspers',
-        'Jayhawks', 'Knights', 'Lumberjacks', 'Lions', 'Lobos', 'Longhorns', 'Matadors',
-        'Mavericks', 'Mean Green', 'Midshipmen', 'Miners', 'Minutemen', 'Monarchs',
-        'Mountaineers', 'Musketeers', 'Mustangs', 'Nittany Lions', 'Norse', 'Orange',
-        'Orangemen', 'Owls', 'Panthers', 'Patriots', 'Peacocks', 'Penguins', 'Phoenix',
-        'Pirates', 'Pioneers', 'Ragin Cajuns', 'Raiders', 'Rams', 'Ramblers', 'Rattlers',
-        'Ravens', 'Razorbacks', 'Rebels', 'Red Flash', 'Red Raiders', 'Red Storm',
-        'Redbirds', 'Redhawks', 'Retrievers', 'Riverhawks', 'Roadrunners', 'Rockets',
-        'Runn Rebels', 'Running Rebels', 'Salukis', 'Scarlet Knights', 'Seahawks',
-        'Seawolves', 'Seminoles', 'Shockers', 'Skyhawks', 'Sooners', 'Spartans',
-        'Spiders', 'Stags', 'Sun Devils', 'Tar Heels', 'Terrapins', 'Terriers',
-        'Thunderbirds', 'Tigers', 'Titans', 'Trojans', 'Utes', 'Vandals', 'Vikings',
-        'Volunteers', 'Waves', 'Wildcats', 'Wolfpack', 'Wolverines', 'Wonders',
-        'Yellow Jackets', 'Zips', 'Screaming Eagles', 'Leathernecks', 'Riverhawks',
-        'Lopes', 'Hatters'
-    ]
-    
     # Remove mascot if present
-    for mascot in mascots:
-        if name.endswith(' ' + mascot):
-            name = name[:-len(mascot)-1]
-            break
+    name = _MASCOT_RE.sub('', name, count=1)
     
     # Handle special cases
-    special_cases = {
-        'UConn': 'Connecticut',
-        'Miami (FL)': 'Miami',
-        'Miami (OH)': 'Miami (OH)',
-        "Saint Mary's (CA)": "Saint Mary's",
-        'Southern California': 'USC',
-        'Central Florida': 'UCF',
-        'Louisiana State': 'LSU',
-        'Texas Christian': 'TCU',
-        'Southern Methodist': 'SMU',
-        'Brigham Young': 'BYU',
-        'Texas-San Antonio': 'UTSA',
-        'Nevada-Las Vegas': 'UNLV',
-        'Mississippi': 'Ole Miss',
-    }
-    
-    if name in special_cases:
-        name = special_cases[name]
-    
-    return name
+    return SPECIAL_CASES.get(name, name)
+
+
+def normalize_odds_team_names(names: pd.Series) -> pd.Series:
+    """Vectorized normalize_odds_team_name over a column of team names (see map_team_names)."""
+    return map_team_names(names, normalize_odds_team_name)
 
 
 def load_markets(markets_path: Union[str, Path]) -> pd.DataFrame:
@@ -123,7 +144,8 @@ def load_markets(markets_path: Union[str, Path]) -> pd.DataFrame:
         markets_path: Path to markets CSV file
         
     Returns:
-        DataFrame with market odds data
+        DataFrame with market odds data, plus home_implied_prob and
+        away_implied_prob derived from the moneylines
         
     Required columns:
         - season, game_day, home_team, away_team
@@ -149,11 +171,16 @@ def load_markets(markets_path: Union[str, Path]) -> pd.DataFrame:
         raise ValueError(f"Missing required columns in markets file: {missing_cols}")
     
     # Normalize team names (remove mascots)
-    df['home_team'] = df['home_team'].apply(normalize_odds_team_name)
-    df['away_team'] = df['away_team'].apply(normalize_odds_team_name)
+    df['home_team'] = normalize_odds_team_names(df['home_team'])
+    df['away_team'] = normalize_odds_team_names(df['away_team'])
+    
+    # Keep game_day as datetime64 so it joins against the merged data's
+    # parsed dates on a fixed-width key
+    df['game_day'] = pd.to_datetime(df['game_day'])
     
-    # Convert game_day to ESPN format (e.g., "November 06, 2023")
-    df['game_day'] = pd.to_datetime(df['game_day']).dt.strftime('%B %d, %Y')
+    # Calculate implied probabilities
+    df['home_implied_prob'] = american_to_prob_array(df['home_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
+    df['away_implied_prob'] = american_to_prob_array(df['away_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
     
     print(f"✅ Loaded {len(df):,} games with market data from {markets_path.name}")
     print(f"   Seasons: {sorted(df['season'].unique())}")
@@ -189,6 +216,40 @@ def american_to_prob(american_odds: float) -> float:
         return 100 / (american_odds + 100)
 
 
+def american_to_prob_array(american_odds) -> np.ndarray:
+    """
+    Vectorized american_to_prob over an array of odds (NaN stays NaN).
+    
+    Whole-number lines in [-_ODDS_LUT_MAX, _ODDS_LUT_MAX] are a single
+    gather from a precomputed table (integer input skips the float
+    conversion entirely); fractional, out-of-range and missing odds go
+    through the formula. Both paths give identical float64 results.
+    
+    Args:
+        american_odds: Array-like (or Series) of American odds
+        
+    Returns:
+        Array of implied probabilities
+    """
+    values = np.asarray(american_odds)
+    if values.dtype.kind != 'i':
+        values = np.asarray(american_odds, dtype=np.float64)
+    
+    with np.errstate(invalid='ignore'):
+        clipped = np.clip(values, -_ODDS_LUT_MAX, _ODDS_LUT_MAX)
+        in_table = clipped == values
+        if values.dtype.kind == 'f':
+            in_table &= clipped == np.rint(clipped)
+            clipped = np.where(in_table, clipped, 0)
+    prob = _ODDS_TO_PROB.take(clipped.astype(np.intp) + _ODDS_LUT_MAX)
+    
+    if not in_table.all():
+        rest = values[~in_table].astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            prob[~in_table] = np.where(rest < 0, -rest / (-rest + 100), 100 / (rest + 100))
+    return prob
+
+
 def join_markets_with_merged(
     merged_df: pd.DataFrame,
     markets_df: pd.DataFrame,
@@ -212,6 +273,7 @@ def join_markets_with_merged(
             - close_spread: Spread from home (team) perspective
             - home_ml, away_ml: Moneyline odds
             - home_implied_prob, away_implied_prob: Implied probabilities
+              (computed by load_markets)
             - close_total: Over/under (if present)
             
     Notes:
@@ -219,30 +281,36 @@ def join_markets_with_merged(
         - If your data has explicit home/away flags, this may need adjustment
         - Unmatched games will be dropped (inner join)
     """
-    # Ensure game_day formats match
-    merged_df = merged_df.copy()
-    markets_df = markets_df.copy()
+    # game_day is joined as datetime64 (load_all_merged_data and load_markets
+    # both parse it); parse here too if the caller passed ESPN date strings
+    if not pd.api.types.is_datetime64_any_dtype(merged_df['game_day']):
+        merged_df = merged_df.assign(game_day=pd.to_datetime(merged_df['game_day'], format='%B %d, %Y'))
     
-    # Normalize game_day format (merged data has "November 06, 2023" format)
-    if 'game_day' in merged_df.columns:
-        # Already in "Month DD, YYYY" format from merged data
-        pass
+    # Only games from seasons the markets file covers can match, so drop
+    # the rest before casting keys and merging
+    total_merged = len(merged_df)
+    merged_df = merged_df[merged_df['season'].isin(markets_df['season'].unique())]
+    
+    # Join on shared categorical team keys so the merge hashes integer codes
+    # instead of team-name strings
+    team_dtype = pd.CategoricalDtype(
+        pd.concat([merged_df['team'], merged_df['opponent'],
+                   markets_df['home_team'], markets_df['away_team']])
+        .dropna().unique()
+    )
+    merged_keyed = merged_df.astype({'team': team_dtype, 'opponent': team_dtype})
+    markets_keyed = markets_df.astype({'home_team': team_dtype, 'away_team': team_dtype})
     
     # Join on season, game_day, and team alignment
     # Assumption: merged_df['team'] = home, merged_df['opponent'] = away
-    joined = merged_df.merge(
-        markets_df,
+    joined = merged_keyed.merge(
+        markets_keyed,
         left_on=['season', 'game_day', 'team', 'opponent'],
         right_on=['season', 'game_day', 'home_team', 'away_team'],
         how='inner'
     )
     
-    # Calculate implied probabilities
-    joined['home_implied_prob'] = joined['home_ml'].apply(american_to_prob)
-    joined['away_implied_prob'] = joined['away_ml'].apply(american_to_prob)
-    
     # Report match statistics
-    total_merged = len(merged_df)
     matched = len(joined)
     match_rate = (matched / total_merged * 100) if total_merged > 0 else 0
     
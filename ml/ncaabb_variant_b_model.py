@@ -18,8 +18,14 @@ import numpy as np
 from pathlib import Path
 import joblib
 import json
+from functools import lru_cache
 from typing import Tuple, Optional
 from datetime import datetime
+import sys
+
+# Shared odds helpers live next to this module
+sys.path.insert(0, str(Path(__file__).parent))
+from markets_ncaabb import american_to_prob_array
 
 # Model artifacts location
 MODEL_DIR = Path(__file__).parent.parent / 'models' / 'variant_b_production'
@@ -27,10 +33,95 @@ MODEL_PATH = MODEL_DIR / 'variant_b_model.pkl'
 SCALER_PATH = MODEL_DIR / 'variant_b_scaler.pkl'
 METADATA_PATH = MODEL_DIR / 'variant_b_metadata.json'
 
+# Bet side labels, stored as categoricals (one byte per row)
+SIDE_DTYPE = pd.CategoricalDtype(['home', 'away'])
+BET_DTYPE = pd.CategoricalDtype(['home_ml', 'away_ml'])
+
+# Tree ensembles split on per-feature thresholds, so they are trained on
+# raw features (as train_eval_model_variant does) and never need a scaler
+_TREE_MODELS = {
+    'GradientBoostingClassifier', 'RandomForestClassifier',
+    'XGBClassifier', 'LGBMClassifier',
+}
+
+# Individual team rolling stats, as (stat_L#_side, side_stat_L#) pairs
+# covering both in-season column formats
+_CANDIDATE_STAT_COLS = [
+    (f'{stat}_L{window}_{side}', f'{side}_{stat}_L{window}')
+    for window in [3, 5, 10]
+    for stat in ['ORtg', 'DRtg', 'Pace', 'MoV', 'WinPct']
+    for side in ['home', 'away']
+]
+
+@lru_cache(maxsize=32)
+def _resolve_features(columns: frozenset) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Resolve the Variant B feature list against a set of column names.
+    
+    Cached per column set, since repeated calls (e.g. across backtest
+    days) almost always see the same columns.
+    
+    Returns:
+        tuple: (available_features, missing_features)
+    """
+    # Define expected features (Variant B specification)
+    VARIANT_B_FEATURES = [
+        # Market features (7)
+        'home_implied_prob', 'away_implied_prob', 'prob_diff', 'vig',
+        'spread_magnitude', 'close_spread_binary', 'home_favorite',
+        
+        # Matchup features (4)
+        'ORtg_vs_DRtg_L5', 'Pace_diff_L5', 'MoV_diff_L5', 'Form_diff_L5'
+    ]
+    
+    # Add individual team rolling stats if available
+    # Check both formats: stat_L#_side and side_stat_L#
+    VARIANT_B_FEATURES.extend(
+        col1 if col1 in columns else col2
+        for col1, col2 in _CANDIDATE_STAT_COLS
+        if col1 in columns or col2 in columns
+    )
+    
+    available_features = tuple(f for f in VARIANT_B_FEATURES if f in columns)
+    missing_features = tuple(f for f in VARIANT_B_FEATURES if f not in columns)
+    return available_features, missing_features
+
+@lru_cache(maxsize=4)
+def _load_artifacts(model_path: Path):
+    """Load model, scaler and metadata from disk (cached per model path)."""
+    scaler_path = model_path.parent / 'variant_b_scaler.pkl'
+    metadata_path = model_path.parent / 'variant_b_metadata.json'
+    
+    # Load model. The production pickle is written zlib-compressed (by the
+    # variant trainer and freeze_variant_b_model.py), which joblib cannot
+    # memory-map, so it is read plainly; the lru_cache keeps it loaded once
+    model = joblib.load(model_path)
+    
+    # Load scaler (if exists and the model can use one)
+    scaler = None
+    if scaler_path.exists():
+        if type(model).__name__ in _TREE_MODELS:
+            print(f"   Skipping scaler: {type(model).__name__} is trained on unscaled features")
+        else:
+            # Returned as trained: sklearn scalers already transform a
+            # float32 buffer into float32, so the statistics stay untouched
+            scaler = joblib.load(scaler_path)
+    
+    # Load metadata
+    metadata = {}
+    if metadata_path.exists():
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+    
+    return model, scaler, metadata
+
 def load_variant_b_model(model_path: Optional[str] = None):
     """
     Load the trained Variant B model + metadata.
     
+    Repeat calls for the same model path in one process reuse the
+    already-loaded model and scaler.
+    
     Returns:
         tuple: (model, scaler, metadata_dict)
     """
@@ -39,28 +130,16 @@ def load_variant_b_model(model_path: Optional[str] = None):
     else:
         model_path = Path(model_path)
     
-    scaler_path = model_path.parent / 'variant_b_scaler.pkl'
-    metadata_path = model_path.parent / 'variant_b_metadata.json'
-    
-    # Load model
     if not model_path.exists():
         raise FileNotFoundError(
             f"Model not found at {model_path}. "
             f"Run scripts/ncaabb/freeze_variant_b_model.py first."
         )
     
-    model = joblib.load(model_path)
-    
-    # Load scaler (if exists)
-    scaler = None
-    if scaler_path.exists():
-        scaler = joblib.load(scaler_path)
+    model, scaler, metadata = _load_artifacts(model_path.resolve())
     
-    # Load metadata
-    metadata = {}
-    if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+    # Hand out a copy so callers can't edit the cached metadata
+    metadata = dict(metadata)
     
     print(f"✅ Loaded Variant B model")
     print(f"   Variant: {metadata.get('variant', 'B')}")
@@ -70,6 +149,22 @@ def load_variant_b_model(model_path: Optional[str] = None):
     
     return model, scaler, metadata
 
+def _add_columns(df: pd.DataFrame, columns: dict) -> pd.DataFrame:
+    """
+    Return df with columns added (or replaced) as one concatenated block.
+    
+    Inserting them one at a time (assign / df[col] = ...) onto a wide
+    read_csv frame leaves it fragmented and makes pandas warn on every
+    insert past ~100 blocks.
+    """
+    block = pd.DataFrame(columns, index=df.index)
+    replaced = block.columns.intersection(df.columns)
+    out = pd.concat([df.drop(columns=replaced), block], axis=1)
+    if len(replaced):
+        # Replaced columns keep their original position, as with assign()
+        out = out[df.columns.append(block.columns.difference(df.columns, sort=False))]
+    return out
+
 def build_market_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Build market-derived features.
@@ -78,34 +173,35 @@ def build_market_features(df: pd.DataFrame) -> pd.DataFrame:
     - home_ml, away_ml (American odds)
     - close_spread (optional)
     """
-    df = df.copy()
+    # Collected here and added as one block rather than copying df up
+    # front and writing the columns into the copy one by one
+    market = {}
     
-    # Convert American odds to implied probabilities
-    def american_to_prob(odds):
-        if odds < 0:
-            return abs(odds) / (abs(odds) + 100)
-        else:
-            return 100 / (odds + 100)
-    
-    df['home_implied_prob'] = df['home_ml'].apply(american_to_prob)
-    df['away_implied_prob'] = df['away_ml'].apply(american_to_prob)
+    # Convert American odds to implied probabilities, whole columns at once
+    home_implied_prob = american_to_prob_array(df['home_ml'])
+    away_implied_prob = american_to_prob_array(df['away_ml'])
+    market['home_implied_prob'] = home_implied_prob
+    market['away_implied_prob'] = away_implied_prob
     
     # Market features
-    df['prob_diff'] = df['home_implied_prob'] - df['away_implied_prob']
-    df['vig'] = (df['home_implied_prob'] + df['away_implied_prob']) - 1.0
+    market['prob_diff'] = home_implied_prob - away_implied_prob
+    market['vig'] = (home_implied_prob + away_implied_prob) - 1.0
     
     # Spread features (if available)
     if 'close_spread' in df.columns:
-        df['spread_magnitude'] = df['close_spread'].abs()
-        df['home_favorite'] = (df['close_spread'] < 0).astype(int)
+        close_spread = df['close_spread'].to_numpy()
+        spread_magnitude = np.abs(close_spread)
+        market['spread_magnitude'] = spread_magnitude
+        market['home_favorite'] = (close_spread < 0).astype(int)
     else:
-        df['spread_magnitude'] = 0.0
-        df['home_favorite'] = (df['home_implied_prob'] > 0.5).astype(int)
+        spread_magnitude = np.zeros(len(df))
+        market['spread_magnitude'] = spread_magnitude
+        market['home_favorite'] = (home_implied_prob > 0.5).astype(int)
     
     # Derived spread feature
-    df['close_spread_binary'] = (df.get('close_spread', 0).abs() <= 3).astype(int)
+    market['close_spread_binary'] = (spread_magnitude <= 3).astype(int)
     
-    return df
+    return _add_columns(df, market)
 
 def build_features_for_games(games_df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -121,63 +217,41 @@ def build_features_for_games(games_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with all 43 Variant B features
     """
-    df = games_df.copy()
-    
-    # 1. Market features
-    df = build_market_features(df)
+    # 1. Market features (returns a new frame, so games_df is left untouched)
+    df = build_market_features(games_df)
     
-    # 2. In-season matchup features (if available)
+    # 2. In-season matchup features (if available), added as one block
+    matchup = {}
     # Handle both column formats: ORtg_L5_home and home_ORtg_L5
     home_ortg = 'ORtg_L5_home' if 'ORtg_L5_home' in df.columns else 'home_ORtg_L5'
     away_drtg = 'DRtg_L5_away' if 'DRtg_L5_away' in df.columns else 'away_DRtg_L5'
     
     if home_ortg in df.columns and away_drtg in df.columns:
-        df['ORtg_vs_DRtg_L5'] = df[home_ortg] - df[away_drtg]
+        matchup['ORtg_vs_DRtg_L5'] = df[home_ortg] - df[away_drtg]
     
     home_pace = 'Pace_L5_home' if 'Pace_L5_home' in df.columns else 'home_Pace_L5'
     away_pace = 'Pace_L5_away' if 'Pace_L5_away' in df.columns else 'away_Pace_L5'
     
     if home_pace in df.columns and away_pace in df.columns:
-        df['Pace_diff_L5'] = df[home_pace] - df[away_pace]
+        matchup['Pace_diff_L5'] = df[home_pace] - df[away_pace]
     
     home_mov = 'MoV_L5_home' if 'MoV_L5_home' in df.columns else 'home_MoV_L5'
     away_mov = 'MoV_L5_away' if 'MoV_L5_away' in df.columns else 'away_MoV_L5'
     
     if home_mov in df.columns and away_mov in df.columns:
-        df['MoV_diff_L5'] = df[home_mov] - df[away_mov]
+        matchup['MoV_diff_L5'] = df[home_mov] - df[away_mov]
     
     home_win = 'WinPct_L5_home' if 'WinPct_L5_home' in df.columns else 'home_WinPct_L5'
     away_win = 'WinPct_L5_away' if 'WinPct_L5_away' in df.columns else 'away_WinPct_L5'
     
     if home_win in df.columns and away_win in df.columns:
-        df['Form_diff_L5'] = df[home_win] - df[away_win]
+        matchup['Form_diff_L5'] = df[home_win] - df[away_win]
     
-    # Define expected features (Variant B specification)
-    VARIANT_B_FEATURES = [
-        # Market features (7)
-        'home_implied_prob', 'away_implied_prob', 'prob_diff', 'vig',
-        'spread_magnitude', 'close_spread_binary', 'home_favorite',
-        
-        # Matchup features (4)
-        'ORtg_vs_DRtg_L5', 'Pace_diff_L5', 'MoV_diff_L5', 'Form_diff_L5'
-    ]
-    
-    # Add individual team rolling stats if available
-    # Check both column formats
-    for window in [3, 5, 10]:
-        for stat in ['ORtg', 'DRtg', 'Pace', 'MoV', 'WinPct']:
-            for side in ['home', 'away']:
-                # Try both formats: stat_L#_side and side_stat_L#
-                col1 = f'{stat}_L{window}_{side}'
-                col2 = f'{side}_{stat}_L{window}'
-                if col1 in df.columns:
-                    VARIANT_B_FEATURES.append(col1)
-                elif col2 in df.columns:
-                    VARIANT_B_FEATURES.append(col2)
+    if matchup:
+        df = _add_columns(df, matchup)
     
     # Check for missing features
-    available_features = [f for f in VARIANT_B_FEATURES if f in df.columns]
-    missing_features = [f for f in VARIANT_B_FEATURES if f not in df.columns]
+    available_features, missing_features = map(list, _resolve_features(frozenset(df.columns)))
     
     if missing_features:
         print(f"⚠️  Warning: {len(missing_features)} features missing")
@@ -186,12 +260,18 @@ def build_features_for_games(games_df: pd.DataFrame) -> pd.DataFrame:
     
     return df, available_features
 
+def _pick_side(home_values, away_values, keep: np.ndarray, side_codes: np.ndarray) -> np.ndarray:
+    """Gather the chosen side's value for each kept row (code 0 = home, 1 = away)."""
+    pairs = np.column_stack((np.asarray(home_values)[keep], np.asarray(away_values)[keep]))
+    return np.take_along_axis(pairs, side_codes.astype(np.intp)[:, None], axis=1)[:, 0]
+
 def predict_variant_b(
     games_df: pd.DataFrame,
     model,
     feature_cols: list,
     min_edge: float = 0.15,
-    scaler=None
+    scaler=None,
+    verbose: bool = True
 ) -> pd.DataFrame:
     """
     Generate Variant B predictions and filter by edge threshold.
@@ -199,17 +279,40 @@ def predict_variant_b(
     Args:
         games_df: DataFrame with features built
         model: Trained model
-        feature_cols: List of feature column names to use
+        feature_cols: List of feature column names to use (the model's own
+            feature_names_in_ order takes precedence when it has one)
         min_edge: Minimum edge threshold (default 0.15)
         scaler: Optional feature scaler
+        verbose: Print the prediction summary (default True)
     
     Returns:
         DataFrame with predictions, edges, and bet recommendations
-    """
-    df = games_df.copy()
     
-    # Prepare features
-    X = df[feature_cols].fillna(0)  # Fill missing with 0 (early season games)
+    Raises:
+        KeyError: If games_df lacks any feature the model needs
+    """
+    # Lay the features out in the order the first estimator was fitted with
+    # (sklearn rejects any other order); feature_cols is the fallback when
+    # it was fitted without names
+    first_step = scaler if scaler is not None else model
+    feature_order = list(getattr(first_step, 'feature_names_in_', feature_cols))
+    
+    # Missing values are filled below, but a whole missing feature column
+    # is an error: predicting on invented zeros would produce bogus bets
+    missing_features = [f for f in feature_order if f not in games_df.columns]
+    if missing_features:
+        raise KeyError(f"{len(missing_features)} model features missing from games_df: {missing_features}")
+    
+    # Prepare features, filling missing values with 0 (early season games),
+    # as one C-contiguous float32 buffer: what the tree model converts to
+    # internally, and what a scaler keeps its output in. It is only
+    # wrapped in a DataFrame (without copying) when the first estimator was
+    # fitted with feature names and would warn about a bare array.
+    X = np.ascontiguousarray(
+        games_df[feature_order].to_numpy(dtype=np.float32, na_value=0.0)
+    )
+    if hasattr(first_step, 'feature_names_in_'):
+        X = pd.DataFrame(X, index=games_df.index, columns=feature_order, copy=False)
     
     # Scale if scaler provided
     if scaler is not None:
@@ -222,52 +325,59 @@ def predict_variant_b(
         # Some models don't have predict_proba
         probs = model.predict(X)
     
-    df['model_prob_home'] = probs
-    df['model_prob_away'] = 1 - probs
-    
-    # Calculate edges for both sides
-    df['edge_home'] = df['model_prob_home'] - df['home_implied_prob']
-    df['edge_away'] = df['model_prob_away'] - df['away_implied_prob']
-    
-    # Determine best bet (if any)
-    df['max_edge'] = df[['edge_home', 'edge_away']].max(axis=1)
-    df['chosen_side'] = df.apply(
-        lambda row: 'home' if row['edge_home'] > row['edge_away'] else 'away',
-        axis=1
-    )
-    
-    # Set recommended bet details
-    df['recommended_bet'] = df.apply(
-        lambda row: f"{row['chosen_side']}_ml",
-        axis=1
-    )
-    
-    df['bet_odds'] = df.apply(
-        lambda row: row['home_ml'] if row['chosen_side'] == 'home' else row['away_ml'],
-        axis=1
-    )
-    
-    df['bet_prob'] = df.apply(
-        lambda row: row['model_prob_home'] if row['chosen_side'] == 'home' else row['model_prob_away'],
-        axis=1
-    )
-    
-    df['bet_implied_prob'] = df.apply(
-        lambda row: row['home_implied_prob'] if row['chosen_side'] == 'home' else row['away_implied_prob'],
-        axis=1
-    )
-    
-    # Filter by edge threshold
-    qualified_bets = df[df['max_edge'] >= min_edge].copy()
-    
-    print(f"\n📊 Prediction Summary:")
-    print(f"   Total games: {len(df)}")
-    print(f"   Bets above {min_edge} edge: {len(qualified_bets)}")
-    if len(qualified_bets) > 0:
-        print(f"   Average edge: {qualified_bets['max_edge'].mean():.3f}")
-        print(f"   Max edge: {qualified_bets['max_edge'].max():.3f}")
-        print(f"   Home bets: {(qualified_bets['chosen_side'] == 'home').sum()}")
-        print(f"   Away bets: {(qualified_bets['chosen_side'] == 'away').sum()}")
+    # Everything below is plain array math; the columns are only attached
+    # (as one block) to the games that clear the edge threshold
+    model_prob_away = 1 - probs
+    edge_home = probs - games_df['home_implied_prob'].to_numpy()
+    edge_away = model_prob_away - games_df['away_implied_prob'].to_numpy()
+    # One ufunc pass for the larger edge. fmax rather than maximum, so a
+    # missing edge on one side doesn't hide the other (the NaN-skipping
+    # behaviour of the DataFrame .max(axis=1) this replaced)
+    max_edge = np.fmax(edge_home, edge_away)
+    
+    # Filter by edge threshold first, so per-side values are only gathered
+    # for the games that are actually bet
+    keep = max_edge >= min_edge
+    
+    # Determine best bet (if any); code 0 = home, 1 = away
+    side_codes = (~(edge_home[keep] > edge_away[keep])).astype(np.int8)
+    
+    bets = {
+        'model_prob_home': probs[keep],
+        'model_prob_away': model_prob_away[keep],
+        
+        # Edges for both sides
+        'edge_home': edge_home[keep],
+        'edge_away': edge_away[keep],
+        'max_edge': max_edge[keep],
+        'chosen_side': pd.Categorical.from_codes(side_codes, dtype=SIDE_DTYPE),
+        
+        # Recommended bet details
+        'recommended_bet': pd.Categorical.from_codes(side_codes, dtype=BET_DTYPE),
+        'bet_odds': _pick_side(games_df['home_ml'], games_df['away_ml'], keep, side_codes),
+        'bet_prob': _pick_side(probs, model_prob_away, keep, side_codes),
+        'bet_implied_prob': _pick_side(
+            games_df['home_implied_prob'], games_df['away_implied_prob'], keep, side_codes
+        ),
+    }
+    
+    qualified_bets = _add_columns(games_df[keep], bets)
+    
+    if verbose:
+        # Emitted as one write rather than a print per line
+        summary = [
+            f"\n📊 Prediction Summary:",
+            f"   Total games: {len(games_df)}",
+            f"   Bets above {min_edge} edge: {len(qualified_bets)}",
+        ]
+        if len(qualified_bets) > 0:
+            summary += [
+                f"   Average edge: {qualified_bets['max_edge'].mean():.3f}",
+                f"   Max edge: {qualified_bets['max_edge'].max():.3f}",
+                f"   Home bets: {(qualified_bets['chosen_side'] == 'home').sum()}",
+                f"   Away bets: {(qualified_bets['chosen_side'] == 'away').sum()}",
+            ]
+        print("\n".join(summary))
     
     return qualified_bets
 
@@ -330,27 +440,21 @@ def add_kelly_stakes(
     Returns:
         DataFrame with kelly_* columns added
     """
-    df = bets_df.copy()
-    
-    # Calculate Kelly for each bet
-    kelly_results = df.apply(
-        lambda row: calculate_kelly_stake(
-            row['max_edge'],
-            row['bet_odds'],
-            kelly_fraction,
-            max_fraction
-        ),
-        axis=1
+    # Calculate Kelly for every bet at once (same math as calculate_kelly_stake)
+    odds = bets_df['bet_odds'].to_numpy(dtype=np.float64)
+    edge = bets_df['max_edge'].to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decimal_odds = np.where(odds < 0, 1 + 100 / np.abs(odds), 1 + odds / 100)
+        full_kelly = edge / (decimal_odds - 1)
+    
+    kelly_applied = np.clip(full_kelly * kelly_fraction, 0, max_fraction)
+    
+    return bets_df.assign(
+        kelly_full=full_kelly,
+        kelly_applied=kelly_applied,
+        # Round bet sizes to nearest dollar
+        bet_size_dollars=np.rint(kelly_applied * bankroll).astype(int),
     )
-    
-    df['kelly_full'] = [k[0] for k in kelly_results]
-    df['kelly_applied'] = [k[1] for k in kelly_results]
-    df['bet_size_dollars'] = df['kelly_applied'] * bankroll
-    
-    # Round bet sizes to nearest dollar
-    df['bet_size_dollars'] = df['bet_size_dollars'].round(0).astype(int)
-    
-    return df
 
 # Test function
 if __name__ == '__main__':
@@ -21,6 +21,36 @@ import pandas as pd
 DATA_DIR = Path(__file__).parent.parent / "data"
 RESULTS_FILE = DATA_DIR / "walkforward_results_with_scores.csv"
 
+# The only results-file columns the checks read (either match flag may be
+# the one present); everything else in the walkforward output is skipped
+RESULT_COLUMNS = {
+    "matched", "result_matched", "edge_spread", "model_spread",
+    "close_spread", "home_covered",
+}
+
+
+def _graded_summary(
+    bet_home: np.ndarray,
+    home_cov: np.ndarray,
+    stake: float,
+    label: str,
+) -> Dict[str, float]:
+    """Win% and ROI at -110 for bets graded against home cover results."""
+    # A bet wins when its side matches the cover result (home & covered, or
+    # away & not covered), which is just equality of the two boolean arrays
+    wins = int(np.count_nonzero(bet_home == home_cov))
+    n_bets = len(bet_home)
+    losses = n_bets - wins
+    profit = wins * (stake * 0.909) - losses * stake
+    roi = (profit / (n_bets * stake)) * 100
+
+    return {
+        "label": label,
+        "bets": n_bets,
+        "win_rate": (wins / n_bets) * 100,
+        "roi": roi,
+    }
+
 
 def _spread_summary(
     df: pd.DataFrame,
@@ -35,25 +65,14 @@ def _spread_summary(
     if missing:
         raise ValueError(f"Missing columns for spread summary: {missing}")
 
-    bets = df[df[edge_column].abs() >= min_edge].copy()
-    if bets.empty:
+    edge = df[edge_column].to_numpy()
+    is_bet = np.abs(edge) >= min_edge
+    if not is_bet.any():
         return {"label": label, "bets": 0, "win_rate": np.nan, "roi": np.nan}
 
-    home_cov = bets["home_covered"].astype(bool)
-    bet_home = bets[edge_column] > 0
-    won = np.where(bet_home, home_cov, ~home_cov)
-
-    wins = won.sum()
-    losses = len(bets) - wins
-    profit = wins * (stake * 0.909) - losses * stake
-    roi = (profit / (len(bets) * stake)) * 100
-
-    return {
-        "label": label,
-        "bets": int(len(bets)),
-        "win_rate": (wins / len(bets)) * 100,
-        "roi": roi,
-    }
+    home_cov = df["home_covered"].astype(bool).to_numpy()[is_bet]
+    bet_home = edge[is_bet] > 0
+    return _graded_summary(bet_home, home_cov, stake, label)
 
 
 def baseline_favorite_strategy(df: pd.DataFrame, stake: float) -> Dict[str, float]:
@@ -61,25 +80,14 @@ def baseline_favorite_strategy(df: pd.DataFrame, stake: float) -> Dict[str, floa
     if "close_spread" not in df.columns:
         raise ValueError("close_spread column missing for baseline test")
 
-    bets = df[df["close_spread"] != 0].copy()
-    if bets.empty:
+    spread = df["close_spread"].to_numpy()
+    is_bet = spread != 0
+    if not is_bet.any():
         return {"label": "Baseline favorite", "bets": 0, "win_rate": np.nan, "roi": np.nan}
 
-    bet_home = bets["close_spread"] < 0  # home favorite => negative spread
-    home_cov = bets["home_covered"].astype(bool)
-    won = np.where(bet_home, home_cov, ~home_cov)
-
-    wins = won.sum()
-    losses = len(bets) - wins
-    profit = wins * (stake * 0.909) - losses * stake
-    roi = (profit / (len(bets) * stake)) * 100
-
-    return {
-        "label": "Baseline favorite",
-        "bets": int(len(bets)),
-        "win_rate": (wins / len(bets)) * 100,
-        "roi": roi,
-    }
+    bet_home = spread[is_bet] < 0  # home favorite => negative spread
+    home_cov = df["home_covered"].astype(bool).to_numpy()[is_bet]
+    return _graded_summary(bet_home, home_cov, stake, "Baseline favorite")
 
 
 def main() -> None:
@@ -90,7 +98,7 @@ def main() -> None:
     parser.add_argument("--seed", type=int, default=42, help="RNG seed for shuffle test")
     args = parser.parse_args()
 
-    df = pd.read_csv(args.results_file)
+    df = pd.read_csv(args.results_file, usecols=lambda col: col in RESULT_COLUMNS)
     if "matched" in df.columns:
         match_mask = df["matched"] == True
     elif "result_matched" in df.columns:
@@ -98,7 +106,7 @@ def main() -> None:
     else:
         raise ValueError("Results file missing 'matched'/'result_matched' columns")
 
-    matched = df[match_mask].copy()
+    matched = df[match_mask]
     if matched.empty:
         raise ValueError("No matched games available for sanity check")
 
@@ -117,12 +125,14 @@ def main() -> None:
         label=f"Real model (edge ≥ {args.min_edge})",
     )
 
-    # Shuffle test: randomly permute model spreads, recompute edges
+    # Shuffle test: randomly permute model spreads, recompute edges. Only
+    # the columns the summary grades on are carried, not a copy of matched
     rng = np.random.default_rng(args.seed)
-    shuffled = matched.copy()
-    shuffled_spreads = shuffled["model_spread"].to_numpy(copy=True)
-    rng.shuffle(shuffled_spreads)
-    shuffled["edge_spread_shuffled"] = shuffled_spreads - shuffled["close_spread"]
+    shuffled_spreads = rng.permutation(matched["model_spread"].to_numpy())
+    shuffled = pd.DataFrame({
+        "edge_spread_shuffled": shuffled_spreads - matched["close_spread"].to_numpy(),
+        "home_covered": matched["home_covered"].to_numpy(),
+    })
 
     shuffled_summary = _spread_summary(
         shuffled,
@@ -8,269 +8,226 @@ This database handles all the variations of team names across different data sou
 - CBBpy
 """
 
-# Master team database - canonical name is the key
-TEAM_DATABASE = {
-    # Power 5 - ACC
-    'Boston College': ['Boston College', 'Boston College Eagles', 'BC', 'BC Eagles'],
-    'Clemson': ['Clemson', 'Clemson Tigers'],
-    'Duke': ['Duke', 'Duke Blue Devils'],
-    'Florida State': ['Florida State', 'Florida St.', 'Florida St', 'FSU', 'Florida State Seminoles'],
-    'Georgia Tech': ['Georgia Tech', 'Georgia Tech Yellow Jackets', 'GT'],
-    'Louisville': ['Louisville', 'Louisville Cardinals'],
-    'Miami': ['Miami', 'Miami (FL)', 'Miami FL', 'Miami Hurricanes', 'The U'],
-    'North Carolina': ['North Carolina', 'UNC', 'North Carolina Tar Heels', 'Tar Heels'],
-    'NC State': ['NC State', 'N.C. State', 'North Carolina State', 'NC State Wolfpack', 'NCSU'],
-    'Notre Dame': ['Notre Dame', 'Notre Dame Fighting Irish'],
-    'Pittsburgh': ['Pittsburgh', 'Pitt', 'Pittsburgh Panthers'],
-    'Syracuse': ['Syracuse', 'Syracuse Orange'],
-    'Virginia': ['Virginia', 'UVA', 'Virginia Cavaliers'],
-    'Virginia Tech': ['Virginia Tech', 'VT', 'Va Tech', 'Virginia Tech Hokies'],
-    'Wake Forest': ['Wake Forest', 'Wake Forest Demon Deacons'],
-    
-    # Power 5 - Big Ten
-    'Illinois': ['Illinois', 'Illinois Fighting Illini', 'Illini'],
-    'Indiana': ['Indiana', 'Indiana Hoosiers', 'IU'],
-    'Iowa': ['Iowa', 'Iowa Hawkeyes'],
-    'Maryland': ['Maryland', 'Maryland Terrapins'],
-    'Michigan': ['Michigan', 'Michigan Wolverines'],
-    'Michigan State': ['Michigan State', 'Michigan St.', 'Michigan St', 'MSU', 'Michigan State Spartans'],
-    'Minnesota': ['Minnesota', 'Minnesota Golden Gophers'],
-    'Nebraska': ['Nebraska', 'Nebraska Cornhuskers'],
-    'Northwestern': ['Northwestern', 'Northwestern Wildcats'],
-    'Ohio State': ['Ohio State', 'Ohio St.', 'Ohio St', 'OSU', 'Ohio State Buckeyes'],
-    'Penn State': ['Penn State', 'Penn St.', 'Penn St', 'PSU', 'Penn State Nittany Lions'],
-    'Purdue': ['Purdue', 'Purdue Boilermakers'],
-    'Rutgers': ['Rutgers', 'Rutgers Scarlet Knights'],
-    'Wisconsin': ['Wisconsin', 'Wisconsin Badgers'],
-    
-    # Power 5 - Big 12
-    'Baylor': ['Baylor', 'Baylor Bears'],
-    'BYU': ['BYU', 'Brigham Young', 'Brigham Young Cougars'],
-    'Cincinnati': ['Cincinnati', 'Cincinnati Bearcats'],
-    'Houston': ['Houston', 'Houston Cougars'],
-    'Iowa State': ['Iowa State', 'Iowa St.', 'Iowa St', 'Iowa State Cyclones'],
-    'Kansas': ['Kansas', 'Kansas Jayhawks', 'KU'],
-    'Kansas State': ['Kansas State', 'Kansas St.', 'Kansas St', 'K-State', 'Kansas State Wildcats'],
-    'Oklahoma': ['Oklahoma', 'Oklahoma Sooners', 'OU'],
-    'Oklahoma State': ['Oklahoma State', 'Oklahoma St.', 'Oklahoma St', 'OSU', 'Oklahoma State Cowboys'],
-    'TCU': ['TCU', 'Texas Christian', 'TCU Horned Frogs'],
-    'Texas': ['Texas', 'Texas Longhorns', 'UT'],
-    'Texas Tech': ['Texas Tech', 'Texas Tech Red Raiders', 'TTU'],
-    'UCF': ['UCF', 'Central Florida', 'UCF Knights'],
-    'West Virginia': ['West Virginia', 'West Virginia Mountaineers', 'WVU'],
-    
-    # Power 5 - Pac-12
-    'Arizona': ['Arizona', 'Arizona Wildcats'],
-    'Arizona State': ['Arizona State', 'Arizona St.', 'Arizona St', 'ASU', 'Arizona State Sun Devils'],
-    'California': ['California', 'Cal', 'Cal Berkeley', 'California Golden Bears'],
-    'Colorado': ['Colorado', 'Colorado Buffaloes'],
-    'Oregon': ['Oregon', 'Oregon Ducks'],
-    'Oregon State': ['Oregon State', 'Oregon St.', 'Oregon St', 'OSU', 'Oregon State Beavers'],
-    'Stanford': ['Stanford', 'Stanford Cardinal'],
-    'UCLA': ['UCLA', 'UCLA Bruins'],
-    'USC': ['USC', 'Southern California', 'Southern Cal', 'USC Trojans'],
-    'Utah': ['Utah', 'Utah Utes'],
-    'Washington': ['Washington', 'Washington Huskies', 'UW'],
-    'Washington State': ['Washington State', 'Washington St.', 'Washington St', 'WSU', 'Washington State Cougars'],
-    
-    # Power 5 - SEC
-    'Alabama': ['Alabama', 'Alabama Crimson Tide', 'Bama'],
-    'Arkansas': ['Arkansas', 'Arkansas Razorbacks'],
-    'Auburn': ['Auburn', 'Auburn Tigers'],
-    'Florida': ['Florida', 'Florida Gators', 'UF'],
-    'Georgia': ['Georgia', 'Georgia Bulldogs', 'UGA'],
-    'Kentucky': ['Kentucky', 'Kentucky Wildcats', 'UK'],
-    'LSU': ['LSU', 'Louisiana State', 'LSU Tigers'],
-    'Mississippi': ['Mississippi', 'Ole Miss', 'Ole Miss Rebels'],
-    'Mississippi State': ['Mississippi State', 'Mississippi St.', 'Mississippi St', 'MSU', 'Mississippi State Bulldogs'],
-    'Missouri': ['Missouri', 'Missouri Tigers', 'Mizzou'],
-    'South Carolina': ['South Carolina', 'South Carolina Gamecocks', 'USC'],
-    'Tennessee': ['Tennessee', 'Tennessee Volunteers', 'Vols'],
-    'Texas A&M': ['Texas A&M', 'Texas A&M Aggies', 'TAMU'],
-    'Vanderbilt': ['Vanderbilt', 'Vanderbilt Commodores'],
-    
-    # Big East
-    'Butler': ['Butler', 'Butler Bulldogs'],
-    'Connecticut': ['Connecticut', 'UConn', 'UCONN', 'Connecticut Huskies'],
-    'Creighton': ['Creighton', 'Creighton Bluejays'],
-    'DePaul': ['DePaul', 'DePaul Blue Demons'],
-    'Georgetown': ['Georgetown', 'Georgetown Hoyas'],
-    'Marquette': ['Marquette', 'Marquette Golden Eagles'],
-    'Providence': ['Providence', 'Providence Friars'],
-    'Seton Hall': ['Seton Hall', 'Seton Hall Pirates'],
-    'St. John\'s': ['St. John\'s', 'Saint John\'s', 'St John\'s', 'St. John\'s Red Storm'],
-    'Villanova': ['Villanova', 'Villanova Wildcats'],
-    'Xavier': ['Xavier', 'Xavier Musketeers'],
-    
-    # WCC
-    'Gonzaga': ['Gonzaga', 'Gonzaga Bulldogs'],
-    'Saint Mary\'s': ['Saint Mary\'s', 'St. Mary\'s', 'Saint Mary\'s Gaels'],
-    'San Francisco': ['San Francisco', 'San Francisco Dons', 'USF'],
-    'Santa Clara': ['Santa Clara', 'Santa Clara Broncos'],
-    'Pepperdine': ['Pepperdine', 'Pepperdine Waves'],
-    'Loyola Marymount': ['Loyola Marymount', 'LMU', 'Loyola Marymount Lions'],
-    'Pacific': ['Pacific', 'Pacific Tigers'],
-    'Portland': ['Portland', 'Portland Pilots'],
-    'San Diego': ['San Diego', 'San Diego Toreros', 'USD'],
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Master team database - canonical name is the key. The names live in a
+# tab-separated data file next to this module (see its header for the format)
+TEAM_DATABASE_FILE = Path(__file__).with_name('team_database.tsv')
+
+
+def _read_team_database(path: Path) -> dict:
+    """Canonical name -> variations, one tab-separated team per line."""
+    teams = {}
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line and not line.startswith('#'):
+            canonical, *variations = line.split('\t')
+            teams[canonical] = variations
+    return teams
+
+
+# Frozen once built: variation tuples behind a read-only view, so nothing can
+# mutate the table the lookup indexes (and cached results) are derived from.
+# Canonical names are interned, so every lookup hands back the one shared
+# string object per team (cheap identity checks, no duplicate copies in the
+# frames and dicts they end up in)
+TEAM_DATABASE = MappingProxyType({
+    sys.intern(canonical): tuple(variations)
+    for canonical, variations in _read_team_database(TEAM_DATABASE_FILE).items()
+})
+
+# Punctuation that sources disagree on ("St. John's" / "St Johns",
+# "Loyola-Chicago" / "Loyola Chicago"): periods and apostrophes dropped,
+# hyphens read as spaces
+_PUNCTUATION = str.maketrans({'.': None, "'": None, '\u2019': None, '-': ' '})
+
+
+def _name_key(name_lower: str) -> str:
+    """Lookup key for a lowercased name: punctuation folded, whitespace collapsed."""
+    return ' '.join(name_lower.translate(_PUNCTUATION).split())
+
+
+# Variation key -> canonical name. Ambiguous abbreviations (e.g. 'MSU')
+# resolve to the first team in TEAM_DATABASE order
+# (built in reverse so the earliest entry is the one left standing).
+# At ~630 short keys (about 50 KB with the keys themselves) a plain dict is
+# already a compact static hash; the values are the shared canonical
+# strings, and the fuzzy index iterates its keys rather than a copy
+_VARIATION_TO_CANONICAL = {
+    _name_key(variation.lower()): canonical
+    for canonical, variations in reversed(TEAM_DATABASE.items())
+    for variation in variations
+}
+
+# Minimum normalized Levenshtein similarity (1 - distance / longer length)
+# for a fuzzy match, which must also point at a single team. Kept high on
+# purpose: real namesakes sit close together ('western michigan' /
+# 'eastern michigan' score 0.875), and a school missing from the table
+# ('eastern kentucky') must not land on its namesake ('western kentucky')
+FUZZY_CUTOFF = 0.92
+
+# Leading words that tell namesakes apart. A fuzzy match never swaps one
+# for another, however long the rest of the name is
+_DIRECTION_WORDS = frozenset([
+    'north', 'northern', 'south', 'southern', 'east', 'eastern',
+    'west', 'western', 'central',
+])
+
+# Fuzzy matches are also capped at this many edits, the depth of the
+# symmetric-delete index that finds them
+FUZZY_MAX_EDITS = 2
+
+# ESPN-style mascots, stripped from the end of "School Mascot" names
+MASCOTS = [
+    'Aggies', 'Aztecs', 'Badgers', 'Bears', 'Bearcats', 'Beavers', 'Bengals',
+    'Billikens', 'Bison', 'Blazers', 'Blue Devils', 'Blue Jays', 'Bluejays',
+    'Bobcats', 'Boilermakers', 'Bonnies', 'Braves', 'Broncos', 'Bruins',
+    'Buckeyes', 'Buffaloes', 'Bulls', 'Bulldogs', 'Camels', 'Cardinals',
+    'Catamounts', 'Cavaliers', 'Chanticleers', 'Chippewas', 'Colonials',
+    'Commodores', 'Cornhuskers', 'Cougars', 'Cowboys', 'Crimson', 'Crusaders',
+    'Cyclones', 'Demons', 'Demon Deacons', 'Devils', 'Dolphins', 'Dons',
+    'Dragons', 'Ducks', 'Dukes', 'Eagles', 'Explorers', 'Falcons', 'Fightin Illini',
+    'Fighting Illini', 'Fighting Irish', 'Flames', 'Flyers', 'Friars',
+    'Gamecocks', 'Gators', 'Gaels', 'Greyhounds', 'Golden Bears', 'Golden Eagles',
+    'Golden Gophers', 'Golden Hurricane', 'Gophers', 'Green Wave', 'Grizzlies',
+    'Hawkeyes', 'Highlanders', 'Hilltoppers', 'Hokies', 'Hoosiers', 'Horned Frogs',
+    'Huskies', 'Hurricanes', 'Indians', 'Jaguars', 'Jayhawks', 'Jets',
+    'Knights', 'Lancers', 'Lions', 'Lumberjacks', 'Mastodons', 'Matadors',
+    'Mavericks', 'Mean Green', 'Midshipmen', 'Miners', 'Minutemen', 'Monarchs',
+    'Mountaineers', 'Musketeers', 'Mustangs', 'Nittany Lions', 'Orange',
+    'Orangemen', 'Owls', 'Panthers', 'Patriots', 'Peacocks', 'Penguins',
+    'Phoenix', 'Pirates', 'Racers', 'Raiders', 'Rainbow Warriors', 'Rams',
+    'Razorbacks', 'Rebels', 'Redbirds', 'Red Flash', 'Red Raiders', 'Red Storm',
+    'Retrievers', 'Roos', 'Running Rebels', 'Salukis', 'Scarlet Knights',
+    'Seminoles', 'Seawolves', 'Seahawks', 'Shockers', 'Sooners', 'Spartans',
+    'Spiders', 'Sun Devils', 'Sycamores', 'Tar Heels', 'Terrapins', 'Terriers',
+    'Thundering Herd', 'Tigers', 'Titans', 'Toreros', 'Trojans', 'Utes',
+    'Vandals', 'Vikings', 'Volunteers', 'Warriors', 'Waves', 'Wildcats',
+    'Wolf Pack', 'Wolfpack', 'Wolverines', 'Yellow Jackets', 'Zips',
+    '49ers', 'Anteaters', 'Roadrunners', 'Tritons', 'Gauchos', 'Cardinal',
+]
+
+# Lowercased mascots, matched as whole suffixes of a name. A suffix can only
+# be a mascot if it spans at most this many spaces, which bounds the scan
+_MASCOT_SUFFIXES = frozenset(mascot.lower() for mascot in MASCOTS)
+_MASCOT_MAX_SPACES = max(mascot.count(' ') for mascot in MASCOTS)
+
+
+def _levenshtein(pattern: str, text: str) -> int:
+    """
+    Levenshtein distance via Myers' bit-parallel algorithm (Hyyrö's form).
     
-    # Mountain West
-    'Boise State': ['Boise State', 'Boise St.', 'Boise St', 'Boise State Broncos'],
-    'Colorado State': ['Colorado State', 'Colorado St.', 'Colorado St', 'CSU', 'Colorado State Rams'],
-    'Fresno State': ['Fresno State', 'Fresno St.', 'Fresno St', 'Fresno State Bulldogs'],
-    'Nevada': ['Nevada', 'Nevada Wolf Pack'],
-    'New Mexico': ['New Mexico', 'New Mexico Lobos', 'UNM'],
-    'San Diego State': ['San Diego State', 'San Diego St.', 'San Diego St', 'SDSU', 'San Diego State Aztecs'],
-    'San Jose State': ['San Jose State', 'San Jose St.', 'San Jose St', 'SJSU', 'San Jose State Spartans'],
-    'UNLV': ['UNLV', 'Nevada Las Vegas', 'UNLV Rebels'],
-    'Utah State': ['Utah State', 'Utah St.', 'Utah St', 'USU', 'Utah State Aggies'],
-    'Wyoming': ['Wyoming', 'Wyoming Cowboys'],
+    Each DP column is held as bit vectors over the pattern, so a text
+    character costs a handful of integer operations instead of a row of
+    cell updates. Python ints are unbounded, so any pattern length works.
+    """
+    if not pattern:
+        return len(text)
     
-    # American Athletic
-    'East Carolina': ['East Carolina', 'ECU', 'East Carolina Pirates'],
-    'Memphis': ['Memphis', 'Memphis Tigers'],
-    'SMU': ['SMU', 'Southern Methodist', 'SMU Mustangs'],
-    'South Florida': ['South Florida', 'USF', 'South Florida Bulls'],
-    'Temple': ['Temple', 'Temple Owls'],
-    'Tulane': ['Tulane', 'Tulane Green Wave'],
-    'Tulsa': ['Tulsa', 'Tulsa Golden Hurricane'],
-    'Wichita State': ['Wichita State', 'Wichita St.', 'Wichita St', 'Wichita State Shockers'],
+    match_masks = {}
+    for position, char in enumerate(pattern):
+        match_masks[char] = match_masks.get(char, 0) | (1 << position)
     
-    # Atlantic 10
-    'Davidson': ['Davidson', 'Davidson Wildcats'],
-    'Dayton': ['Dayton', 'Dayton Flyers'],
-    'Duquesne': ['Duquesne', 'Duquesne Dukes'],
-    'Fordham': ['Fordham', 'Fordham Rams'],
-    'George Mason': ['George Mason', 'George Mason Patriots', 'GMU'],
-    'George Washington': ['George Washington', 'GW', 'George Washington Colonials'],
-    'La Salle': ['La Salle', 'La Salle Explorers'],
-    'UMass': ['UMass', 'Massachusetts', 'UMass Minutemen'],
-    'Rhode Island': ['Rhode Island', 'Rhode Island Rams', 'URI'],
-    'Richmond': ['Richmond', 'Richmond Spiders'],
-    'Saint Joseph\'s': ['Saint Joseph\'s', 'St. Joseph\'s', 'Saint Joseph\'s Hawks'],
-    'Saint Louis': ['Saint Louis', 'St. Louis', 'Saint Louis Billikens', 'SLU'],
-    'VCU': ['VCU', 'Virginia Commonwealth', 'VCU Rams'],
+    full = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    positive, negative, distance = full, 0, len(pattern)
+    for char in text:
+        eq = match_masks.get(char, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        h_positive = negative | (~(xh | positive) & full)
+        h_negative = positive & xh
+        if h_positive & last:
+            distance += 1
+        elif h_negative & last:
+            distance -= 1
+        h_positive = ((h_positive << 1) | 1) & full
+        h_negative = (h_negative << 1) & full
+        positive = h_negative | (~(xv | h_positive) & full)
+        negative = h_positive & xv
+    return distance
+
+
+def _deletes(word: str) -> set:
+    """word plus every string reachable from it by up to FUZZY_MAX_EDITS deletions."""
+    found = frontier = {word}
+    for _ in range(FUZZY_MAX_EDITS):
+        frontier = {shorter[:i] + shorter[i + 1:] for shorter in frontier for i in range(len(shorter))}
+        found = found | frontier
+    return found
+
+
+@lru_cache(maxsize=None)
+def _delete_index() -> dict:
+    """
+    Symmetric-delete (SymSpell) index: deletion variant -> variations.
     
-    # Conference USA
-    'Charlotte': ['Charlotte', 'Charlotte 49ers'],
-    'FAU': ['FAU', 'Florida Atlantic', 'Florida Atlantic Owls'],
-    'FIU': ['FIU', 'Florida International', 'Florida International Panthers'],
-    'Louisiana Tech': ['Louisiana Tech', 'La Tech', 'Louisiana Tech Bulldogs'],
-    'Marshall': ['Marshall', 'Marshall Thundering Herd'],
-    'Middle Tennessee': ['Middle Tennessee', 'Middle Tennessee St.', 'MTSU', 'Middle Tennessee Blue Raiders'],
-    'North Texas': ['North Texas', 'North Texas Mean Green', 'UNT'],
-    'Old Dominion': ['Old Dominion', 'ODU', 'Old Dominion Monarchs'],
-    'Rice': ['Rice', 'Rice Owls'],
-    'UAB': ['UAB', 'Alabama Birmingham', 'UAB Blazers'],
-    'UTEP': ['UTEP', 'Texas El Paso', 'UTEP Miners'],
-    'UTSA': ['UTSA', 'UT San Antonio', 'UTSA Roadrunners'],
-    'Western Kentucky': ['Western Kentucky', 'WKU', 'Western Kentucky Hilltoppers'],
+    Two strings within k edits always share a variant reachable from each
+    by at most k deletions, so a query's own deletions fetch every variation
+    close enough to matter by hashing alone. Built on first fuzzy lookup.
+    """
+    index = {}
+    for variation in _VARIATION_TO_CANONICAL:
+        for variant in _deletes(variation):
+            index.setdefault(variant, []).append(variation)
+    return index
+
+
+def _swaps_direction(name: str, variation: str) -> bool:
+    """True when the two names lead with different direction words ('eastern' / 'western')."""
+    first, other = name.partition(' ')[0], variation.partition(' ')[0]
+    return first != other and first in _DIRECTION_WORDS and other in _DIRECTION_WORDS
+
+
+def _closest_team(name: str) -> Optional[str]:
+    """Team whose nearest variation scores FUZZY_CUTOFF or better, if unambiguous."""
+    index = _delete_index()
+    candidates = {variation for variant in _deletes(name) for variation in index.get(variant, ())}
     
-    # MAC
-    'Akron': ['Akron', 'Akron Zips'],
-    'Ball State': ['Ball State', 'Ball St.', 'Ball St', 'Ball State Cardinals'],
-    'Bowling Green': ['Bowling Green', 'BGSU', 'Bowling Green Falcons'],
-    'Buffalo': ['Buffalo', 'Buffalo Bulls'],
-    'Central Michigan': ['Central Michigan', 'Central Michigan Chippewas', 'CMU'],
-    'Eastern Michigan': ['Eastern Michigan', 'Eastern Michigan Eagles', 'EMU'],
-    'Kent State': ['Kent State', 'Kent St.', 'Kent St', 'Kent State Golden Flashes'],
-    'Miami (OH)': ['Miami (OH)', 'Miami OH', 'Miami Ohio', 'Miami (Ohio)', 'Miami RedHawks'],
-    'Northern Illinois': ['Northern Illinois', 'NIU', 'Northern Illinois Huskies'],
-    'Ohio': ['Ohio', 'Ohio Bobcats'],
-    'Toledo': ['Toledo', 'Toledo Rockets'],
-    'Western Michigan': ['Western Michigan', 'Western Michigan Broncos', 'WMU'],
+    best_distance, best_teams = None, set()
+    for variation in candidates:
+        if _swaps_direction(name, variation):
+            continue
+        longer = max(len(name), len(variation))
+        allowed = min(int(longer * (1 - FUZZY_CUTOFF)), FUZZY_MAX_EDITS)
+        distance = _levenshtein(name, variation)
+        if distance > allowed or (best_distance is not None and distance > best_distance):
+            continue
+        if distance != best_distance:
+            best_distance, best_teams = distance, set()
+        best_teams.add(_VARIATION_TO_CANONICAL[variation])
     
-    # Sun Belt
-    'Appalachian State': ['Appalachian State', 'Appalachian St.', 'App State', 'App St.', 'Appalachian State Mountaineers'],
-    'Arkansas State': ['Arkansas State', 'Arkansas St.', 'Arkansas St', 'A-State', 'Arkansas State Red Wolves'],
-    'Coastal Carolina': ['Coastal Carolina', 'Coastal Carolina Chanticleers', 'CCU'],
-    'Georgia Southern': ['Georgia Southern', 'Georgia Southern Eagles'],
-    'Georgia State': ['Georgia State', 'Georgia St.', 'Georgia St', 'Georgia State Panthers'],
-    'James Madison': ['James Madison', 'JMU', 'James Madison Dukes'],
-    'Louisiana': ['Louisiana', 'Louisiana Lafayette', 'UL Lafayette', 'Louisiana Ragin\' Cajuns'],
-    'South Alabama': ['South Alabama', 'South Alabama Jaguars', 'USA'],
-    'Southern Miss': ['Southern Miss', 'Southern Mississippi', 'USM', 'Southern Miss Golden Eagles'],
-    'Texas State': ['Texas State', 'Texas St.', 'Texas St', 'Texas State Bobcats'],
-    'Troy': ['Troy', 'Troy Trojans'],
-    'ULM': ['ULM', 'Louisiana Monroe', 'UL Monroe', 'Louisiana Monroe Warhawks'],
+    return best_teams.pop() if len(best_teams) == 1 else None
+
+
+def _mascot_split(team_lower: str) -> Optional[int]:
+    """
+    Index of the whitespace before the longest mascot ending team_lower.
     
-    # More mid-majors and small conferences
-    'Air Force': ['Air Force', 'Air Force Falcons'],
-    'Army': ['Army', 'Army Black Knights'],
-    'Navy': ['Navy', 'Navy Midshipmen'],
-    'Bryant': ['Bryant', 'Bryant Bulldogs'],
-    'Colgate': ['Colgate', 'Colgate Raiders'],
-    'Cornell': ['Cornell', 'Cornell Big Red'],
-    'Dartmouth': ['Dartmouth', 'Dartmouth Big Green'],
-    'Harvard': ['Harvard', 'Harvard Crimson'],
-    'Penn': ['Penn', 'Pennsylvania', 'Penn Quakers'],
-    'Princeton': ['Princeton', 'Princeton Tigers'],
-    'Yale': ['Yale', 'Yale Bulldogs'],
-    'Charleston': ['Charleston', 'College of Charleston', 'Charleston Cougars', 'CofC'],
-    'Drexel': ['Drexel', 'Drexel Dragons'],
-    'Hofstra': ['Hofstra', 'Hofstra Pride'],
-    'Delaware': ['Delaware', 'Delaware Fightin\' Blue Hens'],
-    'Towson': ['Towson', 'Towson Tigers'],
-    'UNC Wilmington': ['UNC Wilmington', 'UNCW', 'UNC Wilmington Seahawks'],
-    'William & Mary': ['William & Mary', 'William and Mary', 'William & Mary Tribe'],
-    'Drake': ['Drake', 'Drake Bulldogs'],
-    'Illinois State': ['Illinois State', 'Illinois St.', 'Illinois St', 'ISU', 'Illinois State Redbirds'],
-    'Indiana State': ['Indiana State', 'Indiana St.', 'Indiana St', 'ISU', 'Indiana State Sycamores'],
-    'Loyola Chicago': ['Loyola Chicago', 'Loyola', 'Loyola-Chicago', 'Loyola (IL)', 'Loyola Chicago Ramblers'],
-    'Missouri State': ['Missouri State', 'Missouri St.', 'Missouri St', 'Missouri State Bears'],
-    'Murray State': ['Murray State', 'Murray St.', 'Murray St', 'Murray State Racers'],
-    'Northern Iowa': ['Northern Iowa', 'UNI', 'Northern Iowa Panthers'],
-    'Southern Illinois': ['Southern Illinois', 'SIU', 'Southern Illinois Salukis'],
-    'Valparaiso': ['Valparaiso', 'Valpo', 'Valparaiso Beacons'],
-    'Bradley': ['Bradley', 'Bradley Braves'],
-    'Belmont': ['Belmont', 'Belmont Bruins'],
-    'Liberty': ['Liberty', 'Liberty Flames'],
-    'Lipscomb': ['Lipscomb', 'Lipscomb Bisons'],
-    'North Florida': ['North Florida', 'UNF', 'North Florida Ospreys'],
-    'Stetson': ['Stetson', 'Stetson Hatters'],
-    'Vermont': ['Vermont', 'Vermont Catamounts'],
-    'Albany': ['Albany', 'UAlbany', 'Albany Great Danes'],
-    'Binghamton': ['Binghamton', 'Binghamton Bearcats'],
-    'Maine': ['Maine', 'Maine Black Bears'],
-    'New Hampshire': ['New Hampshire', 'UNH', 'New Hampshire Wildcats'],
-    'Stony Brook': ['Stony Brook', 'Stony Brook Seawolves'],
-    'UMass Lowell': ['UMass Lowell', 'UMass-Lowell', 'UMass Lowell River Hawks'],
-    'UMBC': ['UMBC', 'Maryland Baltimore County', 'UMBC Retrievers'],
-    'UC Irvine': ['UC Irvine', 'UCI', 'UC Irvine Anteaters'],
-    'UC Davis': ['UC Davis', 'UCD', 'UC Davis Aggies'],
-    'UC Riverside': ['UC Riverside', 'UCR', 'UC Riverside Highlanders'],
-    'UC Santa Barbara': ['UC Santa Barbara', 'UCSB', 'UC Santa Barbara Gauchos'],
-    'UC San Diego': ['UC San Diego', 'UCSD', 'UC San Diego Tritons'],
-    'Cal Poly': ['Cal Poly', 'Cal Poly Mustangs'],
-    'Long Beach State': ['Long Beach State', 'Long Beach St.', 'Long Beach St', 'LBSU', 'Long Beach State Beach'],
-    'CSU Bakersfield': ['CSU Bakersfield', 'Cal St. Bakersfield', 'Cal State Bakersfield', 'CSUB'],
-    'CSU Fullerton': ['CSU Fullerton', 'Cal St. Fullerton', 'Cal State Fullerton', 'CSUF'],
-    'CSU Northridge': ['CSU Northridge', 'Cal St. Northridge', 'Cal State Northridge', 'CSUN'],
-    'Hawaii': ['Hawaii', 'Hawai\'i', 'Hawaii Rainbow Warriors'],
-    'Grand Canyon': ['Grand Canyon', 'GCU', 'Grand Canyon Antelopes'],
-    'Seattle': ['Seattle', 'Seattle U', 'Seattle Redhawks'],
-    'Northern Colorado': ['Northern Colorado', 'UNC', 'Northern Colorado Bears'],
-    'North Dakota': ['North Dakota', 'UND', 'North Dakota Fighting Hawks'],
-    'North Dakota State': ['North Dakota State', 'North Dakota St.', 'NDSU', 'North Dakota State Bison'],
-    'South Dakota': ['South Dakota', 'South Dakota Coyotes', 'USD'],
-    'South Dakota State': ['South Dakota State', 'South Dakota St.', 'SDSU', 'South Dakota State Jackrabbits'],
-    'Oral Roberts': ['Oral Roberts', 'ORU', 'Oral Roberts Golden Eagles'],
-    'Denver': ['Denver', 'Denver Pioneers'],
-    'Omaha': ['Omaha', 'Nebraska Omaha', 'UNO', 'Omaha Mavericks'],
-    'Western Illinois': ['Western Illinois', 'Western Illinois Leathernecks', 'WIU'],
-    'Southern Utah': ['Southern Utah', 'SUU', 'Southern Utah Thunderbirds'],
-    'Weber State': ['Weber State', 'Weber St.', 'Weber St', 'Weber State Wildcats'],
-    'Idaho': ['Idaho', 'Idaho Vandals'],
-    'Idaho State': ['Idaho State', 'Idaho St.', 'Idaho St', 'ISU', 'Idaho State Bengals'],
-    'Montana': ['Montana', 'Montana Grizzlies'],
-    'Montana State': ['Montana State', 'Montana St.', 'Montana St', 'MSU', 'Montana State Bobcats'],
-    'Eastern Washington': ['Eastern Washington', 'Eastern Washington Eagles', 'EWU'],
-    'Portland State': ['Portland State', 'Portland St.', 'Portland St', 'PSU', 'Portland State Vikings'],
-    'Sacramento State': ['Sacramento State', 'Sacramento St.', 'Sac State', 'CSUS'],
-    'Northern Arizona': ['Northern Arizona', 'NAU', 'Northern Arizona Lumberjacks'],
-}
+    Walks back from the end one whitespace character at a time and probes
+    the suffix after it against the mascot set, so the cost depends on the
+    length of the last few words rather than on the number of mascots.
+    """
+    split, spaces = None, 0
+    for position in range(len(team_lower) - 1, -1, -1):
+        if team_lower[position].isspace():
+            if team_lower[position + 1:] in _MASCOT_SUFFIXES:
+                split = position
+            spaces += 1
+            if spaces > _MASCOT_MAX_SPACES:
+                break
+    return split
 
 
-def normalize_team_name(team: str) -> str:
+@lru_cache(maxsize=4096)
+def normalize_team_name(team: str, fuzzy: bool = False) -> str:
     """
     Normalize any team name to its canonical form.
     CRITICAL: Strips ESPN-style mascots before database lookup.
@@ -282,67 +239,108 @@ def normalize_team_name(team: str) -> str:
     
     Args:
         team: Team name in any format
+        fuzzy: If no exact variation matches, fall back to the closest
+            variation scoring at least FUZZY_CUTOFF (catches typos, at the
+            risk of mapping an unknown team onto a similarly named one)
         
     Returns:
         Canonical team name
     """
     team = team.strip()
+    team_lower = team.lower()
     
     # Step 1: Strip ESPN-style mascots (School + Mascot format)
     # This is the KEY FIX - ESPN returns "Duke Blue Devils", we need "Duke"
-    mascots = [
-        'Aggies', 'Aztecs', 'Badgers', 'Bears', 'Bearcats', 'Beavers', 'Bengals',
-        'Billikens', 'Bison', 'Blazers', 'Blue Devils', 'Blue Jays', 'Bluejays',
-        'Bobcats', 'Boilermakers', 'Bonnies', 'Braves', 'Broncos', 'Bruins',
-        'Buckeyes', 'Buffaloes', 'Bulls', 'Bulldogs', 'Camels', 'Cardinals',
-        'Catamounts', 'Cavaliers', 'Chanticleers', 'Chippewas', 'Colonials',
-        'Commodores', 'Cornhuskers', 'Cougars', 'Cowboys', 'Crimson', 'Crusaders',
-        'Cyclones', 'Demons', 'Demon Deacons', 'Devils', 'Dolphins', 'Dons',
-        'Dragons', 'Ducks', 'Dukes', 'Eagles', 'Explorers', 'Falcons', 'Fightin Illini',
-        'Fighting Illini', 'Fighting Irish', 'Flames', 'Flyers', 'Friars',
-        'Gamecocks', 'Gators', 'Gaels', 'Greyhounds', 'Golden Bears', 'Golden Eagles',
-        'Golden Gophers', 'Golden Hurricane', 'Gophers', 'Green Wave', 'Grizzlies',
-        'Hawkeyes', 'Highlanders', 'Hilltoppers', 'Hokies', 'Hoosiers', 'Horned Frogs',
-        'Huskies', 'Hurricanes', 'Indians', 'Jaguars', 'Jayhawks', 'Jets',
-        'Knights', 'Lancers', 'Lions', 'Lumberjacks', 'Mastodons', 'Matadors',
-        'Mavericks', 'Mean Green', 'Midshipmen', 'Miners', 'Minutemen', 'Monarchs',
-        'Mountaineers', 'Musketeers', 'Mustangs', 'Nittany Lions', 'Orange',
-        'Orangemen', 'Owls', 'Panthers', 'Patriots', 'Peacocks', 'Penguins',
-        'Phoenix', 'Pirates', 'Racers', 'Raiders', 'Rainbow Warriors', 'Rams',
-        'Razorbacks', 'Rebels', 'Redbirds', 'Red Flash', 'Red Raiders', 'Red Storm',
-        'Retrievers', 'Roos', 'Running Rebels', 'Salukis', 'Scarlet Knights',
-        'Seminoles', 'Seawolves', 'Seahawks', 'Shockers', 'Sooners', 'Spartans',
-        'Spiders', 'Sun Devils', 'Sycamores', 'Tar Heels', 'Terrapins', 'Terriers',
-        'Thundering Herd', 'Tigers', 'Titans', 'Toreros', 'Trojans', 'Utes',
-        'Vandals', 'Vikings', 'Volunteers', 'Warriors', 'Waves', 'Wildcats',
-        'Wolf Pack', 'Wolfpack', 'Wolverines', 'Yellow Jackets', 'Zips',
-        '49ers', 'Anteaters', 'Roadrunners', 'Tritons', 'Gauchos', 'Cardinal',
-    ]
+    split = _mascot_split(team_lower)
+    mascot = split is not None
+    stripped = team[:split].rstrip() if mascot else team
+    stripped_lower = stripped.lower() if mascot else team_lower
     
-    # Remove mascot if found at end (case-insensitive)
-    team_lower = team.lower()
-    for mascot in mascots:
-        mascot_lower = mascot.lower()
-        if team_lower.endswith(f' {mascot_lower}'):
-            # Strip the mascot, keeping the school name
-            team = team[:-(len(mascot)+1)].strip()
-            break
+    # Step 2: Case- and punctuation-insensitive lookup with original and stripped version
+    # (the second probe only when a mascot actually came off).
+    # If not found, return stripped version (better than full ESPN name)
+    canonical = _VARIATION_TO_CANONICAL.get(_name_key(team_lower))
+    if canonical is None and mascot:
+        canonical = _VARIATION_TO_CANONICAL.get(_name_key(stripped_lower))
     
-    # Step 2: Search through database with original and stripped version
-    for canonical_name, variations in TEAM_DATABASE.items():
-        if team in variations:
-            return canonical_name
-        # Case-insensitive match
-        if team.lower() in [v.lower() for v in variations]:
-            return canonical_name
+    # Step 3 (optional): closest variation by edit distance
+    if canonical is None and fuzzy:
+        canonical = _closest_team(_name_key(stripped_lower))
     
-    # If not found, return stripped version (better than full ESPN name)
-    return team
+    return stripped if canonical is None else canonical
 
 
-def get_team_variations(canonical_name: str) -> list:
+def map_team_names(names: 'pd.Series', normalize: Callable[[str], str]) -> 'pd.Series':
+    """
+    Apply a per-name normalize function to a column of team names.
+    
+    Missing values stay missing. A categorical column comes back
+    categorical over the normalized names (categories that normalize alike
+    are merged); any other column keeps its dtype. pandas is imported here
+    rather than at module level, so plain name lookups don't pay for it.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    # A season of games repeats a few hundred team names thousands of times,
+    # so normalize each distinct name once and broadcast back by code
+    categorical = isinstance(names.dtype, pd.CategoricalDtype)
+    if categorical:
+        codes, uniques = names.cat.codes.to_numpy(), names.cat.categories
+    else:
+        codes, uniques = pd.factorize(names)
+    cleaned = uniques.map(normalize)
+    
+    if categorical:
+        category_codes, categories = pd.factorize(cleaned)
+        codes = np.where(codes >= 0, category_codes[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories), index=names.index, name=names.name
+        )
+    return pd.Series(
+        cleaned.take(codes, fill_value=np.nan), index=names.index, name=names.name, dtype=names.dtype
+    )
+
+
+def normalize_team_names(names: 'pd.Series', fuzzy: bool = False) -> 'pd.Series':
+    """Vectorized normalize_team_name over a column of team names (see map_team_names)."""
+    return map_team_names(names, lambda team: normalize_team_name(team, fuzzy))
+
+def get_team_variations(canonical_name: str) -> tuple:
     """Get all variations of a team name"""
-    return TEAM_DATABASE.get(canonical_name, [canonical_name])
+    return TEAM_DATABASE.get(canonical_name, (canonical_name,))
+
+
+@lru_cache(maxsize=None)
+def _search_index() -> tuple:
+    """
+    Lookup tables behind search_team / search_team_prefix.
+    
+    Built on the first search rather than at import, since most importers
+    only ever call normalize_team_name.
+    
+    Returns:
+        (rows, trigram_index, sorted_names) where rows holds one
+        (canonical, variations, lowercased names) tuple per team in
+        TEAM_DATABASE order (the name set includes the canonical name),
+        trigram_index maps each trigram to the rows with a name containing
+        it, and sorted_names pairs every lowercased name with its row, sorted
+        so that names sharing a prefix form one contiguous run
+    """
+    rows = [
+        (canonical, variations,
+         frozenset([canonical.lower(), *(variation.lower() for variation in variations)]))
+        for canonical, variations in TEAM_DATABASE.items()
+    ]
+    
+    trigram_index = {}
+    for row, (_, _, names) in enumerate(rows):
+        for name in names:
+            for start in range(len(name) - 2):
+                trigram_index.setdefault(name[start:start + 3], set()).add(row)
+    
+    sorted_names = sorted((name, row) for row, (_, _, names) in enumerate(rows) for name in names)
+    return rows, trigram_index, sorted_names
 
 
 def search_team(query: str) -> list:
@@ -355,13 +353,46 @@ def search_team(query: str) -> list:
     Returns:
         List of (canonical_name, variations) tuples
     """
+    rows, trigram_index, _ = _search_index()
     query_lower = query.lower()
     matches = []
     
-    for canonical, variations in TEAM_DATABASE.items():
-        if query_lower in canonical.lower():
-            matches.append((canonical, variations))
-        elif any(query_lower in v.lower() for v in variations):
+    # Narrow to teams sharing every trigram of the query (shortest posting
+    # list first); queries under three characters check every team
+    if len(query_lower) >= 3:
+        postings = sorted(
+            (trigram_index.get(query_lower[start:start + 3], set())
+             for start in range(len(query_lower) - 2)),
+            key=len,
+        )
+        candidates = [rows[row] for row in sorted(postings[0].intersection(*postings[1:]))]
+    else:
+        candidates = rows
+    
+    for canonical, variations, names in candidates:
+        if any(query_lower in name for name in names):
             matches.append((canonical, variations))
     
     return matches
+
+
+def search_team_prefix(prefix: str) -> list:
+    """
+    Find teams with any name (canonical or variation) starting with prefix.
+    
+    Args:
+        prefix: Start of a team name, case-insensitive
+        
+    Returns:
+        List of (canonical_name, variations) tuples, in TEAM_DATABASE order
+    """
+    rows, _, sorted_names = _search_index()
+    prefix_lower = prefix.lower()
+    found = set()
+    
+    position = bisect_left(sorted_names, (prefix_lower,))
+    while position < len(sorted_names) and sorted_names[position][0].startswith(prefix_lower):
+        found.add(sorted_names[position][1])
+        position += 1
+    
+    return [rows[row][:2] for row in sorted(found)]
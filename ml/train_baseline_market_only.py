@@ -32,16 +32,11 @@ from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, roc_auc_score, brier_score_loss, log_loss
 import json
+import sys
 
-
-def american_to_prob(odds: float) -> float:
-    """Convert American odds to implied probability"""
-    if pd.isna(odds):
-        return np.nan
-    if odds < 0:
-        return abs(odds) / (abs(odds) + 100)
-    else:
-        return 100 / (odds + 100)
+# Shared odds helpers live next to this module
+sys.path.insert(0, str(Path(__file__).parent))
+from markets_ncaabb import american_to_prob_array
 
 
 def build_market_features(df: pd.DataFrame) -> tuple:
@@ -57,8 +52,8 @@ def build_market_features(df: pd.DataFrame) -> tuple:
     features = df.copy()
     
     # Market-implied probabilities
-    features['home_implied_prob'] = features['home_ml'].apply(american_to_prob)
-    features['away_implied_prob'] = features['away_ml'].apply(american_to_prob)
+    features['home_implied_prob'] = american_to_prob_array(features['home_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
+    features['away_implied_prob'] = american_to_prob_array(features['away_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
     
     # Market expectations
     features['home_favorite'] = (features['close_spread'] < 0).astype(int)
@@ -173,8 +168,8 @@ def calculate_ml_edge_pnl(test_df: pd.DataFrame, model_probs: np.ndarray,
     test_df['model_away_prob'] = 1 - model_probs
     
     # Calculate edges
-    test_df['home_implied_prob'] = test_df['home_ml'].apply(american_to_prob)
-    test_df['away_implied_prob'] = test_df['away_ml'].apply(american_to_prob)
+    test_df['home_implied_prob'] = american_to_prob_array(test_df['home_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
+    test_df['away_implied_prob'] = american_to_prob_array(test_df['away_ml'].to_numpy(dtype=np.float64, na_value=np.nan))
     test_df['home_ml_edge'] = test_df['model_home_prob'] - test_df['home_implied_prob']
     test_df['away_ml_edge'] = test_df['model_away_prob'] - test_df['away_implied_prob']
     
@@ -44,6 +44,10 @@ def load_all_merged_data(data_dir: str, max_season: int = None) -> pd.DataFrame:
     
     combined = pd.concat(dfs, ignore_index=True)
     
+    # Parse ESPN-style game dates ("November 06, 2023") once, up front
+    if 'game_day' in combined.columns:
+        combined['game_day'] = pd.to_datetime(combined['game_day'], format='%B %d, %Y')
+    
     print(f"✅ Loaded {len(combined):,} games from {len(dfs)} files")
     print(f"   Seasons: {sorted(combined['season'].unique())}")
     
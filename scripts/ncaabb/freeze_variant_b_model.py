@@ -59,7 +59,8 @@ def freeze_variant_b_model():
     
     # Save the actual model
     model_path = prod_dir / 'variant_b_model.pkl'
-    joblib.dump(model, model_path)
+    # Same zlib compression as the variant trainer writes production models with
+    joblib.dump(model, model_path, compress=('zlib', 3))
     print(f"\n✅ Model saved to: {model_path}")
     
     # Save feature columns